@@ -1,15 +1,14 @@
 # TODO: remove
 from data.example.database.models import Base
 
+MODELS = tuple(Base.__subclasses__())
+
 
 def get_model_docs():
-    docs = {}
-    for model in Base.__subclasses__():
-        print(f"model: {vars(model)['__annotations__']}")
-        docs[model.__name__] = (
-            model.__doc__.strip() if model.__doc__ else "No description available."
-        )
-    return docs
+    return {
+        model.__name__: (model.__doc__ or "No description available.").strip()
+        for model in MODELS
+    }
 
 
 def main():
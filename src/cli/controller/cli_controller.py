@@ -5,7 +5,7 @@ import requests
 from cli.service.cli_service import CliService
 
 
-@dataclass
+@dataclass(slots=True)
 class CliController:
     """
     Attributes:
@@ -1,11 +1,11 @@
 from cli.controller.cli_controller import CliController
+from cli.service.cli_service import create_session
 from utils.logger.app_logger import ApplicationLogger
-import json
-import requests
 
 if __name__ == "__main__":
     cli_controller = CliController()
     logger = ApplicationLogger()
+    session = create_session()
 
     while True:
         template = cli_controller.choose_template()
@@ -22,10 +22,10 @@ if __name__ == "__main__":
 
         try:
             url, endpoint, headers, parameters = cli_controller.parse_response(
-                json.loads(response.content)["response"]
+                response.json()["response"]
             )
 
-            response = requests.post(
+            response = session.post(
                 url=f"{url}{endpoint}", json=parameters, headers=headers
             )
             logger.debug(
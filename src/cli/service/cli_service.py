@@ -5,19 +5,45 @@ from pathlib import Path
 from typing import Any
 import cutie
 import requests
+from requests.adapters import HTTPAdapter
 from llm.utils.prompt_request import PromptRequest
-from dotenv import load_dotenv
+from utils.env import ensure_env_loaded
 from utils.logger.app_logger import ApplicationLogger
 
-load_dotenv()
+ensure_env_loaded()
 
+LOGGER = ApplicationLogger()
 
-@dataclass
+TEMPLATES: list[str] = json.loads(
+    os.getenv("TEMPLATES", '["Templates:", "generate_docstring", "example", "exit"]')
+)
+PROMPT_OPTIONS: list[str] = json.loads(
+    os.getenv("PROMPT_OPTIONS", '["Prompt Options:", "file", "enter prompt"]')
+)
+
+
+def create_session() -> requests.Session:
+    """
+    Creates a requests session that keeps connections to the LLM API alive between prompts.
+
+    Returns:
+        requests.Session: A session with a pooled HTTP adapter mounted for http and https.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@dataclass(slots=True)
 class CliService:
     """
     Attributes:
         llm_url (str): The URL for language model operations.
         cli_logger (ApplicationLogger): The logger for CLI operations.
+        session (requests.Session): The session reused for all requests to the LLM API.
+        last_template (str | None): The template chosen in the previous iteration, if any.
 
     Methods:
         choose_template() -> str: Choose a template from available options.
@@ -30,12 +56,18 @@ class CliService:
     llm_url: str = field(
         default_factory=lambda: os.getenv("LLM_URL", "http://localhost:8000/prompt")
     )
-    cli_logger: ApplicationLogger = field(default_factory=lambda: ApplicationLogger())
+    cli_logger: ApplicationLogger = field(default_factory=lambda: LOGGER)
+    session: requests.Session = field(default_factory=create_session)
+    last_template: str | None = None
 
     def choose_template(self) -> str:
         """
         Choose a template from available options.
 
+        Once a template was chosen, an option to repeat it is offered and preselected,
+        so rerunning the last template only takes a single keypress. If only one template is
+        configured, it is returned without showing the menu.
+
         Args:
             None
 
@@ -43,10 +75,26 @@ class CliService:
             str: Selected template.
 
         """
-        templates = json.loads(os.getenv("TEMPLATES", '["Templates:", "generate_docstring", "example", "exit"]'))  # type: ignore
-        return templates[
-            cutie.select(templates, caption_indices=[0], selected_index=len(templates))  # type: ignore
+        if len(TEMPLATES) == 2:
+            return TEMPLATES[1]
+
+        templates = TEMPLATES
+        selected_index = len(TEMPLATES) - 1
+        repeat_option = None
+
+        if self.last_template is not None:
+            repeat_option = f"repeat last ({self.last_template})"
+            templates = [TEMPLATES[0], repeat_option, *TEMPLATES[1:]]
+            selected_index = 1
+
+        template = templates[
+            cutie.select(templates, caption_indices=[0], selected_index=selected_index)  # type: ignore
         ]
+        if template == repeat_option:
+            template = self.last_template
+
+        self.last_template = template
+        return template
 
     def choose_prompt_option(self) -> str:
         """
@@ -58,12 +106,12 @@ class CliService:
         Returns:
             str: Selected prompt option.
         """
-        prompt_options = json.loads(
-            os.getenv("PROMPT_OPTIONS", '["Prompt Options:", "file", "enter prompt"]')
-        )
-        return prompt_options[
+        if len(PROMPT_OPTIONS) == 2:
+            return PROMPT_OPTIONS[1]
+
+        return PROMPT_OPTIONS[
             cutie.select(
-                prompt_options, caption_indices=[0], selected_index=len(prompt_options)
+                PROMPT_OPTIONS, caption_indices=[0], selected_index=len(PROMPT_OPTIONS)
             )
         ]
 
@@ -79,20 +127,17 @@ class CliService:
         """
         match prompt_option:
             case "file":
-                file_path = Path(
-                    f'files/{input("Enter the file name without file ending (e.g. example):\n")}.txt'
+                file_name = input(
+                    "Enter the file name without file ending (e.g. example):\n"
                 )
-                try:
-                    assert os.path.exists(
-                        file_path
-                    ), f"Error {file_path} does not exist in {Path('files')}"
-                except AssertionError as e:
-                    error_msg = f"Error when fetching file containing prompt: {e}"
+                file_path = Path(f"files/{file_name}.txt")
+                if not file_path.is_file():
+                    error_msg = f"Error when fetching file containing prompt: Error {file_path} does not exist in {Path('files')}"
                     self.cli_logger.error(error_msg)
                     raise AssertionError(error_msg)
 
-                with open(file_path) as file:
-                    prompt = "\n".join(file.readlines())
+                with open(file_path, encoding="utf-8") as file:
+                    prompt = file.read()
             case "enter prompt":
                 prompt = input("Enter your prompt:\n")
             case _:
@@ -111,7 +156,11 @@ class CliService:
             requests.Response: The response from the prompt execution.
         """
         prompt_request = PromptRequest(prompt=prompt, template_name=template)
-        return requests.post(self.llm_url, prompt_request.toJSON())
+        return self.session.post(
+            self.llm_url,
+            data=prompt_request.model_dump_json(),
+            headers={"Content-Type": "application/json"},
+        )
 
     def parse_response(
         self, response: dict[Any, Any]
@@ -0,0 +1,109 @@
+# OpenAPI response documentation of the example API, only imported if the API docs are enabled
+from typing import Any
+
+IMPORT_RESPONSES = {
+    200: {
+        "description": "Successful insertion of the csv file",
+        "content": {
+            "application/json": {
+                "example": {"status": "success", "message": "import completed"}
+            }
+        },
+    },
+    400: {
+        "description": "Insertion of the csv file failed",
+    },
+}
+
+FETCH_BY_GENDER_AND_LEVEL_RESPONSES = {
+    200: {
+        "description": "Fetch all students with a specific gender and academic level",
+        "content": {
+            "application/json": {
+                "example": {
+                    "status": "success",
+                    "data": "[{'id':703,'relationship_status':'IN RELATIONSHIP','age':21,'affects_academic_performance':true,'sleep_hours_per_night':6.7,'mental_health_score':6,'conflicts_over_social_media':3,'addicted_score':7,'gender':'FEMALE','academic_level':'UNDERGRADUATE','country_name':'China'},"
+                    "{'id':705,'relationship_status':'SINGLE','age':19,'affects_academic_performance':true,'sleep_hours_per_night':6.3,'mental_health_score':5,'conflicts_over_social_media':4,'addicted_score':8,'gender': 'FEMALE','academic_level':'UNDERGRADUATE','country_: '100'  name':'Poland'}]",
+                    "count": "2",
+                }
+            }
+        },
+    },
+    400: {
+        "description": "Failed to fetch students based on a gender and the academic level"
+    },
+}
+
+FETCH_DAILY_USE_FOR_COUNTRY_RESPONSES = {
+    200: {
+        "description": "Fetch average daily usage for all students from a country",
+        "context": {
+            "application/json": {"example": {"status": "success", "value": "5.26"}}
+        },
+    },
+    400: {"description": "Failed to fetch average daily use for a country"},
+}
+
+FETCH_CONFLICTS_OVER_THRESHOLD_RESPONSES = {
+    200: {
+        "description": "Fetch all students with a certain conflict score",
+        "context": {
+            "application/json": {
+                "example": {
+                    "status": "success",
+                    "data": "[{'id':703,'relationship_status':'IN RELATIONSHIP','age':21,'affects_academic_performance':true,'sleep_hours_per_night':6.7,'mental_health_score':6,'conflicts_over_social_media':3,'addicted_score':7,'gender':'FEMALE','academic_level':'UNDERGRADUATE','country_name':'China'},"
+                    "{'id':705,'relationship_status':'SINGLE','age':19,'affects_academic_performance':true,'sleep_hours_per_night':6.3,'mental_health_score':5,'conflicts_over_social_media':3,'addicted_score':8,'gender': 'FEMALE','academic_level':'UNDERGRADUATE','country_: '100'  name':'Poland'}]",
+                    "count": "2",
+                }
+            }
+        },
+    },
+    400: {"description": "Faield to fetch students with conflict score"},
+}
+
+FETCH_STUDENTS_BY_AFFECTED_FLAG_RESPONSES = {
+    200: {
+        "description": "Fecth all students with the specific affected flag",
+        "content": {
+            "application/json": {
+                "example": {
+                    "status": "success",
+                    "value": "[{'id':703,'relationship_status':'IN RELATIONSHIP','age':21,'affects_academic_performance':true,'sleep_hours_per_night':6.7,'mental_health_score':6,'conflicts_over_social_media':3,'addicted_score':7,'gender':'FEMALE','academic_level':'UNDERGRADUATE','country_name':'China'},"
+                    "{'id':705,'relationship_status':'SINGLE','age':19,'affects_academic_performance':true,'sleep_hours_per_night':6.3,'mental_health_score':5,'conflicts_over_social_media':4,'addicted_score':8,'gender': 'FEMALE','academic_level':'UNDERGRADUATE','country_: '100'  name':'Poland'}]",
+                    "count": "2",
+                }
+            }
+        },
+    },
+    400: {
+        "description": "Failed to fetch students with the affected flag either being true or false, depending on the query parameter"
+    },
+}
+
+FETCH_STUDENT_BY_COUNTRY_AND_MENTAL_HEALTH_THRESHOLD_RESPONSES = {
+    200: {
+        "description": "Fetched all students from a specific country with a specific mental health score",
+        "content": {
+            "application/json": {
+                "example": {
+                    "status": "success",
+                    "value": "[{'id':703,'relationship_status':'IN RELATIONSHIP','age':21,'affects_academic_performance':true,'sleep_hours_per_night':6.7,'mental_health_score':6,'conflicts_over_social_media':3,'addicted_score':7,'gender':'FEMALE','academic_level':'UNDERGRADUATE','country_name':'China'},"
+                    "{'id':705,'relationship_status':'SINGLE','age':19,'affects_academic_performance':true,'sleep_hours_per_night':6.3,'mental_health_score':6,'conflicts_over_social_media':4,'addicted_score':8,'gender': 'FEMALE','academic_level':'UNDERGRADUATE','country_: '100'  name':'China'}]",
+                    "count": "2",
+                }
+            }
+        },
+    },
+    400: {
+        "description": "Failed to fetch all students from a country with the specific mental health score"
+    },
+}
+
+RESPONSES: dict[str, dict[int | str, dict[str, Any]]] = {
+    "/students/import": IMPORT_RESPONSES,
+    "/students/fetch_by_gender_and_level": FETCH_BY_GENDER_AND_LEVEL_RESPONSES,
+    "/students/fetch_daily_use_for_country": FETCH_DAILY_USE_FOR_COUNTRY_RESPONSES,
+    "/students/fetch_conflicts_over_threshold": FETCH_CONFLICTS_OVER_THRESHOLD_RESPONSES,
+    "/students/fetch_students_by_affected_flag": FETCH_STUDENTS_BY_AFFECTED_FLAG_RESPONSES,
+    "/students/fetch_student_by_country_and_mental_health_threshold": FETCH_STUDENT_BY_COUNTRY_AND_MENTAL_HEALTH_THRESHOLD_RESPONSES,
+}
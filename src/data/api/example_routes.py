@@ -1,7 +1,8 @@
-import simplejson as json
 from pathlib import Path
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
+from typing import Any
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from utils.orjson_response import ORJSONResponse
 from utils.request_models import (
     GenderAndAcademicLevelRequest,
     AffectedStatusRequest,
@@ -12,21 +13,58 @@ from utils.request_models import (
 from data.example.controller.database_controller import (
     DatabaseController,
     get_database_controller,
+    get_gender_and_academic_level_fetcher,
 )
-from data.example.utils.EAcademicLevel import EAcademicLevel
-from data.example.utils.EGender import EGender
 from utils.logger.app_logger import ApplicationLogger, get_application_logger
+from utils.batched_fetcher import BatchedFetcher
 import os
-from dotenv import load_dotenv
+from utils.env import ensure_env_loaded, get_bool_env
+from utils.ttl_cache import TTLCache
 
-router = APIRouter()
-load_dotenv()
+router = APIRouter(default_response_class=ORJSONResponse)
+ensure_env_loaded()
 
-insert_data_env: str = os.getenv("INSERT_EXAMPLE_DATA", "True")
-if insert_data_env == "True":
-    insert_data = True
-else:
-    insert_data = False
+insert_data: bool = get_bool_env("INSERT_EXAMPLE_DATA", True)
+docs_enabled: bool = os.getenv("ENV") != "prod"
+
+# the response examples are only needed for the OpenAPI docs, which are disabled in production
+RESPONSES: dict[str, dict[int | str, dict[str, Any]]] = {}
+if docs_enabled:
+    from data.api.example_responses import RESPONSES
+
+# serialized responses of the fetch endpoints, cleared whenever new data is imported
+response_cache = TTLCache(ttl=float(os.getenv("RESPONSE_CACHE_TTL", "60")))
+
+
+def get_cached_response(cache_key: str) -> Response | None:
+    """
+    Returns the cached response body for a request if there is one.
+
+    Args:
+        cache_key (str): The key built from the endpoint and its request parameters.
+
+    Returns:
+        Response | None: A response with the cached JSON body or None if nothing is cached.
+    """
+    cached = response_cache.get(cache_key)
+    if cached is None:
+        return None
+    return Response(content=cached, media_type="application/json")
+
+
+def cache_response(cache_key: str, response: ORJSONResponse) -> ORJSONResponse:
+    """
+    Stores the serialized body of a response in the response cache.
+
+    Args:
+        cache_key (str): The key built from the endpoint and its request parameters.
+        response (ORJSONResponse): The response to cache.
+
+    Returns:
+        ORJSONResponse: The unchanged response.
+    """
+    response_cache.set(cache_key, response.body)
+    return response
 
 
 @router.get("/")
@@ -37,7 +75,7 @@ async def health_check():
     Returns:
         dict: A dictionary with a message key indicating health status.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "status": "success",
             "message": "Hello World",
@@ -45,47 +83,45 @@ async def health_check():
     )
 
 
-@router.get(
-    "/students/import",
-    responses={
-        200: {
-            "description": "Successful insertion of the csv file",
-            "content": {
-                "application/json": {
-                    "example": {"status": "success", "message": "import completed"}
-                }
-            },
-        },
-        400: {
-            "description": "Insertion of the csv file failed",
-        },
-    },
-)
+@router.get("/students/import", responses=RESPONSES.get("/students/import"))
 async def import_students(
     db_controller: DatabaseController = Depends(get_database_controller),
     api_logger: ApplicationLogger = Depends(get_application_logger),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Import students data from a CSV file into the database.
+    The import is skipped if INSERT_EXAMPLE_DATA is disabled.
 
     Args:
         None
 
     Returns:
-        JSONRepsone: A dictionary with a status key indicating the import completion.
+        ORJSONResponse: A dictionary with a status key indicating the import completion.
     """
+    if not insert_data:
+        api_logger.debug("Skipping import, INSERT_EXAMPLE_DATA is disabled")
+        return ORJSONResponse(
+            content={
+                "status": "skipped",
+                "message": "import disabled",
+            },
+            status_code=200,
+        )
+
     try:
         api_logger.debug(f"Starting inserting data process - Reading csv file")
-        df = db_controller.read_csv(
+        df = await run_in_threadpool(
+            db_controller.read_csv,
             Path("example/datasets/Students_Social_Media_Addiction.csv"),
             "Student_ID",
         )
 
         api_logger.debug(f"Starting inserting data")
-        db_controller.insert_data(df)
+        await run_in_threadpool(db_controller.insert_data, df)
+        response_cache.clear()
 
         api_logger.debug(f"Finished inserting data")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "success",
                 "message": "import completed",
@@ -99,56 +135,48 @@ async def import_students(
 
 @router.post(
     "/students/fetch_by_gender_and_level",
-    responses={
-        200: {
-            "description": "Fetch all students with a specific gender and academic level",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "status": "success",
-                        "data": "[{'id':703,'relationship_status':'IN RELATIONSHIP','age':21,'affects_academic_performance':true,'sleep_hours_per_night':6.7,'mental_health_score':6,'conflicts_over_social_media':3,'addicted_score':7,'gender':'FEMALE','academic_level':'UNDERGRADUATE','country_name':'China'},"
-                        "{'id':705,'relationship_status':'SINGLE','age':19,'affects_academic_performance':true,'sleep_hours_per_night':6.3,'mental_health_score':5,'conflicts_over_social_media':4,'addicted_score':8,'gender': 'FEMALE','academic_level':'UNDERGRADUATE','country_: '100'  name':'Poland'}]",
-                        "count": "2",
-                    }
-                }
-            },
-        },
-        400: {
-            "description": "Failed to fetch students based on a gender and the academic level"
-        },
-    },
+    responses=RESPONSES.get("/students/fetch_by_gender_and_level"),
 )
 async def fetch_by_gender_and_academic_level(
     request: GenderAndAcademicLevelRequest,
-    db_controller: DatabaseController = Depends(get_database_controller),
+    fetcher: BatchedFetcher = Depends(get_gender_and_academic_level_fetcher),
     api_logger: ApplicationLogger = Depends(get_application_logger),
-) -> JSONResponse:
+) -> Response:
     """
     Fetches students based on gender and academic level.
+    Concurrent requests are coalesced into a single query.
 
     Args:
         request (GenderAndAcademicLevelRequest): The request containing gender and academic level filters.
-        db_controller (DatabaseController, optional): Dependency injection for database controller. Defaults to Depends(get_database_controller).
+        fetcher (BatchedFetcher, optional): Dependency injection for the batched gender and academic level lookup. Defaults to Depends(get_gender_and_academic_level_fetcher).
         api_logger (ApplicationLogger, optional): Dependency injection for API logger. Defaults to Depends(get_application_logger).
 
     Returns:
-        JSONResponse: A response containing the status of the operation, fetched data, and count.
+        Response: A response containing the status of the operation, fetched data, and count.
     """
+    cache_key = f"gender_and_level:{request.gender}:{request.academic_level}"
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         api_logger.debug(
-            f"Fetching students: gender={request.gender}, academic_level={request.academic_level}"
-        )
-        results = db_controller.fetch_by_gender_and_academic_level(
-            EGender(request.gender), EAcademicLevel(request.academic_level)
+            "Fetching students: gender={}, academic_level={}",
+            request.gender,
+            request.academic_level,
         )
-
-        return JSONResponse(
-            content={
-                "status": "success",
-                "data": results,
-                "count": len(results),
-            },
-            status_code=200,
+        results = await fetcher.submit((request.gender, request.academic_level))
+
+        return cache_response(
+            cache_key,
+            ORJSONResponse(
+                content={
+                    "status": "success",
+                    "data": results,
+                    "count": len(results),
+                },
+                status_code=200,
+            ),
         )
     except Exception as e:
         error = f"Failed to fetch students: {e}"
@@ -158,21 +186,13 @@ async def fetch_by_gender_and_academic_level(
 
 @router.post(
     "/students/fetch_daily_use_for_country",
-    responses={
-        200: {
-            "description": "Fetch average daily usage for all students from a country",
-            "context": {
-                "application/json": {"example": {"status": "success", "value": "5.26"}}
-            },
-        },
-        400: {"description": "Failed to fetch average daily use for a country"},
-    },
+    responses=RESPONSES.get("/students/fetch_daily_use_for_country"),
 )
 async def fetch_daily_use_for_country(
     request: CountryRequest,
     db_controller: DatabaseController = Depends(get_database_controller),
     api_logger: ApplicationLogger = Depends(get_application_logger),
-) -> JSONResponse:
+) -> Response:
     """
     Fetches average daily usage for a given country.
 
@@ -183,16 +203,28 @@ async def fetch_daily_use_for_country(
         api_logger (ApplicationLogger, optional): Dependency injection for API logger. Defaults to Depends(get_application_logger).
 
     Returns:
-        JSONResponse: A response containing the status of the operation and the average daily usage data.
+        Response: A response containing the status of the operation and the average daily usage data.
     """
+    cache_key = f"daily_use:{request.country}"
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        api_logger.debug(f"Fetching average daily usage for country: {request.country}")
-        result = db_controller.fetch_avg_daily_usage_for_country(request.country)
-        return JSONResponse(
-            content={
-                "status": "success",
-                "value": json.dumps(result, use_decimal=True),
-            }
+        api_logger.debug(
+            "Fetching average daily usage for country: {}", request.country
+        )
+        result = await run_in_threadpool(
+            db_controller.fetch_avg_daily_usage_for_country, request.country
+        )
+        return cache_response(
+            cache_key,
+            ORJSONResponse(
+                content={
+                    "status": "success",
+                    "value": result,
+                }
+            ),
         )
     except Exception as e:
         error = f"Failed to fetch average daily use: {e}"
@@ -202,28 +234,13 @@ async def fetch_daily_use_for_country(
 
 @router.post(
     "/students/fetch_conflicts_over_threshold",
-    responses={
-        200: {
-            "description": "Fetch all students with a certain conflict score",
-            "context": {
-                "application/json": {
-                    "example": {
-                        "status": "success",
-                        "data": "[{'id':703,'relationship_status':'IN RELATIONSHIP','age':21,'affects_academic_performance':true,'sleep_hours_per_night':6.7,'mental_health_score':6,'conflicts_over_social_media':3,'addicted_score':7,'gender':'FEMALE','academic_level':'UNDERGRADUATE','country_name':'China'},"
-                        "{'id':705,'relationship_status':'SINGLE','age':19,'affects_academic_performance':true,'sleep_hours_per_night':6.3,'mental_health_score':5,'conflicts_over_social_media':3,'addicted_score':8,'gender': 'FEMALE','academic_level':'UNDERGRADUATE','country_: '100'  name':'Poland'}]",
-                        "count": "2",
-                    }
-                }
-            },
-        },
-        400: {"description": "Faield to fetch students with conflict score"},
-    },
+    responses=RESPONSES.get("/students/fetch_conflicts_over_threshold"),
 )
 async def fetch_conflicts_over_threshold(
     request: ThresholdRequest,
     db_controller: DatabaseController = Depends(get_database_controller),
     api_logger: ApplicationLogger = Depends(get_application_logger),
-) -> JSONResponse:
+) -> Response:
     """
     Fetches students with conflict scores above a given threshold.
 
@@ -233,15 +250,25 @@ async def fetch_conflicts_over_threshold(
         api_logger (ApplicationLogger, optional): Dependency injection for API logger. Defaults to Depends(get_application_logger).
 
     Returns:
-        JSONResponse: A response containing the status of the operation, fetched data, and count.
+        Response: A response containing the status of the operation, fetched data, and count.
     """
+    cache_key = f"conflicts:{request.threshold}"
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         api_logger.debug(
-            f"Fetching students with conflict score above: {request.threshold}"
+            "Fetching students with conflict score above: {}", request.threshold
+        )
+        results = await run_in_threadpool(
+            db_controller.fetch_conflicts_over_threshold, request.threshold
         )
-        results = db_controller.fetch_conflicts_over_threshold(request.threshold)
-        return JSONResponse(
-            content={"status": "success", "value": results, "count": len(results)}
+        return cache_response(
+            cache_key,
+            ORJSONResponse(
+                content={"status": "success", "value": results, "count": len(results)}
+            ),
         )
     except Exception as e:
         error = f"Failed to fetch students with conflict score: {e}"
@@ -251,30 +278,13 @@ async def fetch_conflicts_over_threshold(
 
 @router.post(
     "/students/fetch_students_by_affected_flag",
-    responses={
-        200: {
-            "description": "Fecth all students with the specific affected flag",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "status": "success",
-                        "value": "[{'id':703,'relationship_status':'IN RELATIONSHIP','age':21,'affects_academic_performance':true,'sleep_hours_per_night':6.7,'mental_health_score':6,'conflicts_over_social_media':3,'addicted_score':7,'gender':'FEMALE','academic_level':'UNDERGRADUATE','country_name':'China'},"
-                        "{'id':705,'relationship_status':'SINGLE','age':19,'affects_academic_performance':true,'sleep_hours_per_night':6.3,'mental_health_score':5,'conflicts_over_social_media':4,'addicted_score':8,'gender': 'FEMALE','academic_level':'UNDERGRADUATE','country_: '100'  name':'Poland'}]",
-                        "count": "2",
-                    }
-                }
-            },
-        },
-        400: {
-            "description": "Failed to fetch students with the affected flag either being true or false, depending on the query parameter"
-        },
-    },
+    responses=RESPONSES.get("/students/fetch_students_by_affected_flag"),
 )
 async def fetch_students_by_affected_flag(
     request: AffectedStatusRequest,
     db_controller: DatabaseController = Depends(get_database_controller),
     api_logger: ApplicationLogger = Depends(get_application_logger),
-) -> JSONResponse:
+) -> Response:
     """
     Fetches students based on their affected flag.
 
@@ -284,13 +294,25 @@ async def fetch_students_by_affected_flag(
         api_logger (ApplicationLogger, optional): Dependency injection for API logger. Defaults to Depends(get_application_logger).
 
     Returns:
-        JSONResponse: A response containing the status of the operation, fetched data, and count.
+        Response: A response containing the status of the operation, fetched data, and count.
     """
+    cache_key = f"affected:{request.is_affected}"
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        api_logger.debug(f"Fetching students with affected flag: {request.is_affected}")
-        results = db_controller.fetch_students_by_affected_flag(request.is_affected)
-        return JSONResponse(
-            content={"status": "success", "value": results, "count": len(results)}
+        api_logger.debug(
+            "Fetching students with affected flag: {}", request.is_affected
+        )
+        results = await run_in_threadpool(
+            db_controller.fetch_students_by_affected_flag, request.is_affected
+        )
+        return cache_response(
+            cache_key,
+            ORJSONResponse(
+                content={"status": "success", "value": results, "count": len(results)}
+            ),
         )
     except Exception as e:
         error = f"Failed to fetch students with affected flag: {e}"
@@ -300,30 +322,13 @@ async def fetch_students_by_affected_flag(
 
 @router.post(
     "/students/fetch_student_by_country_and_mental_health_threshold",
-    responses={
-        200: {
-            "description": "Fetched all students from a specific country with a specific mental health score",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "status": "success",
-                        "value": "[{'id':703,'relationship_status':'IN RELATIONSHIP','age':21,'affects_academic_performance':true,'sleep_hours_per_night':6.7,'mental_health_score':6,'conflicts_over_social_media':3,'addicted_score':7,'gender':'FEMALE','academic_level':'UNDERGRADUATE','country_name':'China'},"
-                        "{'id':705,'relationship_status':'SINGLE','age':19,'affects_academic_performance':true,'sleep_hours_per_night':6.3,'mental_health_score':6,'conflicts_over_social_media':4,'addicted_score':8,'gender': 'FEMALE','academic_level':'UNDERGRADUATE','country_: '100'  name':'China'}]",
-                        "count": "2",
-                    }
-                }
-            },
-        },
-        400: {
-            "description": "Failed to fetch all students from a country with the specific mental health score"
-        },
-    },
+    responses=RESPONSES.get("/students/fetch_student_by_country_and_mental_health_threshold"),
 )
 async def fetch_students_by_country_and_mental_health(
     request: CountryAndMentalHealthRequest,
     db_controller: DatabaseController = Depends(get_database_controller),
     api_logger: ApplicationLogger = Depends(get_application_logger),
-) -> JSONResponse:
+) -> Response:
     """
     Fetches students based on their mental health score within a specific country.
 
@@ -333,17 +338,31 @@ async def fetch_students_by_country_and_mental_health(
         api_logger (ApplicationLogger, optional): Dependency injection for API logger. Defaults to Depends(get_application_logger).
 
     Returns:
-        JSONResponse: A response containing the status of the operation, fetched data, and count.
+        Response: A response containing the status of the operation, fetched data, and count.
     """
+    cache_key = (
+        f"country_and_mental_health:{request.country}:{request.mental_health_score}"
+    )
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         api_logger.debug(
-            f"Fetching students with mental health score: {request.mental_health_score} in country: {request.country}"
+            "Fetching students with mental health score: {} in country: {}",
+            request.mental_health_score,
+            request.country,
         )
-        results = db_controller.fetch_students_by_country_and_mental_health(
-            request.country, request.mental_health_score
+        results = await run_in_threadpool(
+            db_controller.fetch_students_by_country_and_mental_health,
+            request.country,
+            request.mental_health_score,
         )
-        return JSONResponse(
-            content={"status": "success", "value": results, "count": len(results)}
+        return cache_response(
+            cache_key,
+            ORJSONResponse(
+                content={"status": "success", "value": results, "count": len(results)}
+            ),
         )
     except Exception as e:
         error = f"Failed to fetch students with mental health threshold from a specific country: {e}"
@@ -1,4 +1,6 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
+import os
 from decimal import Decimal
 from typing import Any, Sequence
 import pandas as pd
@@ -8,6 +10,7 @@ from pathlib import Path
 
 from data.example.utils.EAcademicLevel import EAcademicLevel
 from data.example.utils.EGender import EGender
+from utils.batched_fetcher import BatchedFetcher
 
 
 @dataclass
@@ -23,6 +26,7 @@ class DatabaseController:
         read_csv(self, filepath: Path, index_column: str) -> pd.DataFrame: Reads data from a CSV file and returns it as a pandas DataFrame.
         insert_data(self, df: pd.DataFrame) -> None: Inserts the provided pandas DataFrame into the database.
         fetch_by_gender_and_academic_level(gender: EGender, academic_level: EAcademicLevel) -> list[dict[Any, Any]]: Fetch students by gender and academic level.
+        fetch_by_genders_and_academic_levels(keys: list[tuple[EGender, EAcademicLevel]]) -> dict[tuple[EGender, EAcademicLevel], list[dict[Any, Any]]]: Fetch students for several gender and academic level combinations.
         fetch_avg_daily_usage_for_country(country: str) -> Decimal | None: Fetch average daily usage for a specific country.
         fetch_conflicts_over_threshold(threshold: int) -> list[dict[Any, Any]]: Fetch conflicts over a given threshold.
         fetch_students_by_affected_flag(is_affected: bool) -> list[dict[Any, Any]]: Fetch students by their affected flag.
@@ -35,6 +39,9 @@ class DatabaseController:
         """
         Reads data from a CSV file and returns it as a pandas DataFrame.
 
+        The parser is selected with the CSV_BACKEND environment variable (c, python or pyarrow).
+        It defaults to the c parser, the multithreaded pyarrow parser has to be selected explicitly.
+
         Args:
             filepath (Path): The path to the CSV file.
             index_column (str): The name of the column to use as the index for the DataFrame.
@@ -42,7 +49,8 @@ class DatabaseController:
         Returns:
             pd.DataFrame: A pandas DataFrame containing the data from the CSV file, with the specified column set as the index.
         """
-        return pd.read_csv(filepath, index_col=index_column)
+        engine = os.getenv("CSV_BACKEND", "c")
+        return pd.read_csv(filepath, index_col=index_column, engine=engine)
 
     def insert_data(self, df: pd.DataFrame) -> None:
         """
@@ -70,6 +78,20 @@ class DatabaseController:
             gender, academic_level
         )
 
+    def fetch_by_genders_and_academic_levels(
+        self, keys: list[tuple[EGender, EAcademicLevel]]
+    ) -> dict[tuple[EGender, EAcademicLevel], list[dict[Any, Any]]]:
+        """
+        Fetch students for several gender and academic level combinations.
+
+        Args:
+            keys (list[tuple[EGender, EAcademicLevel]]): The combinations of gender and academic level to fetch.
+
+        Returns:
+            dict[tuple[EGender, EAcademicLevel], list[dict[Any, Any]]]: The fetched students grouped by their combination.
+        """
+        return self.database_service.fetch_by_genders_and_academic_levels(keys)
+
     def fetch_avg_daily_usage_for_country(self, country: str) -> Decimal | None:
         """
         Fetch average daily usage for a specific country.
@@ -126,11 +148,28 @@ class DatabaseController:
         )
 
 
+@lru_cache(maxsize=1)
 def get_database_controller() -> DatabaseController:
     """
-    Returns a new instance of DatabaseController.
+    Returns the shared instance of DatabaseController.
+
+    The instance is created on the first call and reused afterwards, so all requests share
+    the same database service, engine and connection pool.
 
     Returns:
-        DatabaseController: A new instance of DatabaseController with default values for its attributes.
+        DatabaseController: The shared instance of DatabaseController with default values for its attributes.
     """
     return DatabaseController()
+
+
+@lru_cache(maxsize=1)
+def get_gender_and_academic_level_fetcher() -> BatchedFetcher:
+    """
+    Returns the shared BatchedFetcher coalescing concurrent gender and academic level lookups.
+
+    Returns:
+        BatchedFetcher: A BatchedFetcher backed by the shared DatabaseController.
+    """
+    return BatchedFetcher(
+        get_database_controller().fetch_by_genders_and_academic_levels
+    )
@@ -1,15 +1,138 @@
 from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+import hashlib
+import io
 from typing import Any
-from dotenv import load_dotenv
 import os
+import numpy as np
 from pandas import DataFrame
-from sqlalchemy import MetaData, Table, create_engine, inspect, text
-from sqlalchemy.engine.base import Engine
-from data.example.database.models import Base
+from pandas.api.types import is_float_dtype
+from sqlalchemy import Integer, MetaData, Table, create_engine, inspect, select
+from sqlalchemy.engine import URL
+from sqlalchemy.engine.base import Connection, Engine
+from sqlalchemy.pool import NullPool
+from utils.env import ensure_env_loaded, get_bool_env
 from utils.logger.app_logger import ApplicationLogger
 
+# maps an engine url to the fingerprint of the schema that was last created and verified on it
+_verified_schemas: dict[str, str] = {}
+# number of rows serialized into one in-memory CSV buffer per COPY
+COPY_CHUNK_SIZE: int = 100_000
 
-@dataclass
+
+@lru_cache(maxsize=None)
+def get_engine(
+    dialect: str,
+    driver: str,
+    username: str,
+    password: str,
+    host: str,
+    port: str,
+    database: str,
+) -> Engine:
+    """
+    Creates a SQLAlchemy engine for the given connection details, reusing an existing one for the same DSN.
+
+    The connection pool is configured through the environment variables SQLA_POOL_SIZE, SQLA_POOL_OVERFLOW
+    and SQLA_POOL_RECYCLE. Setting SQLA_POOLCLASS to NullPool disables pooling (e.g. for tests).
+    Executemany calls are batched into multi-row statements of up to 1000 rows. On PostgreSQL a server side
+    statement timeout in milliseconds can be set with SQLA_STATEMENT_TIMEOUT_MS. The size of the compiled
+    statement cache is set with SQLA_QUERY_CACHE_SIZE.
+
+    Args:
+        dialect (str): The SQL dialect used by the database.
+        driver (str): The database driver to use.
+        username (str): The username for accessing the database.
+        password (str): The password for accessing the database.
+        host (str): The host where the database server is running.
+        port (str): The port on which the database server is listening.
+        database (str): The name of the database.
+
+    Returns:
+        Engine: The cached SQLAlchemy engine for the DSN.
+    """
+    dsn = URL.create(
+        drivername=f"{dialect}+{driver}",
+        username=username,
+        password=password,
+        host=host,
+        port=int(port),
+        database=database,
+    )
+    engine_options: dict[str, Any] = {
+        # compiled statements are cached per query shape, the filter values are always sent as bound parameters
+        "query_cache_size": int(os.getenv("SQLA_QUERY_CACHE_SIZE", "1200")),
+        # rows per multi-row INSERT when executing many parameter sets
+        "insertmanyvalues_page_size": 1000,
+    }
+
+    if driver == "psycopg2":
+        # batches executemany calls into multi-row INSERTs (insertmanyvalues) and execute_batch pages
+        engine_options["executemany_mode"] = "values_plus_batch"
+        engine_options["executemany_batch_page_size"] = 500
+
+    statement_timeout = os.getenv("SQLA_STATEMENT_TIMEOUT_MS")
+    if dialect == "postgresql" and statement_timeout:
+        engine_options["connect_args"] = {
+            "options": f"-c statement_timeout={int(statement_timeout)}"
+        }
+
+    if os.getenv("SQLA_POOLCLASS", "QueuePool") == "NullPool":
+        return create_engine(dsn, poolclass=NullPool, **engine_options)
+
+    return create_engine(
+        dsn,
+        **engine_options,
+        pool_size=int(os.getenv("SQLA_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("SQLA_POOL_OVERFLOW", "20")),
+        pool_pre_ping=True,
+        pool_recycle=int(os.getenv("SQLA_POOL_RECYCLE", "3600")),
+    )
+
+
+def warm_up_pool(engine: Engine, size: int) -> None:
+    """
+    Opens `size` connections at once and returns them to the pool, so the first requests don't pay for the connection setup.
+
+    Engines without a pool (NullPool) are skipped, since they would close the connections right away.
+
+    Args:
+        engine (Engine): The engine whose pool is filled.
+        size (int): The number of connections to open.
+    """
+    if isinstance(engine.pool, NullPool):
+        return
+
+    connections = []
+    try:
+        for _ in range(size):
+            connections.append(engine.connect())
+    except Exception as e:
+        ApplicationLogger().warning("Error when warming up the connection pool: {}", e)
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def get_metadata_fingerprint(metadata: MetaData) -> str:
+    """
+    Computes a fingerprint of the tables and columns defined in the given metadata.
+
+    Args:
+        metadata (MetaData): The metadata to fingerprint.
+
+    Returns:
+        str: A hash of the sorted table names and their column names.
+    """
+    signature = ";".join(
+        f"{name}:{','.join(sorted(table.columns.keys()))}"
+        for name, table in sorted(metadata.tables.items())
+    )
+    return hashlib.sha256(signature.encode()).hexdigest()
+
+
+@dataclass(slots=True)
 class DatabaseManager:
     """
     Manages the database connection and ensures that all expected tables are created.
@@ -22,13 +145,20 @@ class DatabaseManager:
         port (str): The port on which the database server is listening.
         dialect (str): The SQL dialect used by the database.
         driver (str): The database driver to use.
+        metadata (MetaData, optional): Metadata holding the table definitions. Defaults to the metadata of the ORM models.
         database_logger (ApplicationLogger, optional): Logger for database-related activities. Defaults to a new `ApplicationLogger`.
-        engine (Engine): The SQLAlchemy engine object used for connecting to and managing the database.
+        engine (Engine, optional): The SQLAlchemy engine object used for connecting to and managing the database. Defaults to the shared engine for the connection details.
 
     Methods:
         __post_init__(): Initializes the database connection and verifies that all expected tables are created.
         insert_dimension_tables(table_name: str, column_name: str, data: list[dict[str, Any]]) -> None | dict[str, int]: Inserts data into a specified database table.
+        insert_many_dimension_tables(specs: list[tuple[str, str, list[dict[str, Any]]]]) -> None | dict[str, dict[str, int]]: Inserts data into several dimension tables within a single transaction.
         insert_fact_table(table_name: str, data: DataFrame) -> None: Inserts data into a fact table.
+        __get_table(table_name: str) -> None | Table: Looks up a table in the metadata.
+        __insert_dimension(connection: Connection, table: Table, column_name: str, data: list[dict[str, Any]]) -> dict[str, int]: Inserts the new rows into a dimension table and maps the values to their ids.
+        __get_dimension_key(value: Any) -> str: Converts a dimension value into the lowercased key used in the id dicts.
+        __cast_to_table_types(table_name: str, data: DataFrame) -> DataFrame: Rounds decimal values that are loaded into integer columns.
+        __copy_dataframe(connection: Connection, table_name: str, data: DataFrame) -> None: Streams a DataFrame into a table using PostgreSQL's COPY.
     """
 
     database: str
@@ -38,11 +168,11 @@ class DatabaseManager:
     port: str
     dialect: str
     driver: str
-    metadata: MetaData = field(default_factory=lambda: MetaData())
+    metadata: MetaData | None = None
     database_logger: ApplicationLogger = field(
         default_factory=lambda: ApplicationLogger()
     )
-    engine: Engine = field(init=False)
+    engine: Engine | None = None
 
     def __post_init__(self) -> None:
         """
@@ -51,25 +181,47 @@ class DatabaseManager:
         This method is called automatically after the instance of the class has been initialized.
         It sets up the database engine using the provided credentials and dialect, creates all tables
         defined in the Base metadata, and checks if the correct number of tables have been created.
+        Engines are shared per DSN unless one is passed in, and the table creation is skipped if the same schema was already
+        verified on that engine. The verification can be disabled by setting VALIDATE_SCHEMA to false.
 
         Raises:
             Exception: If an error occurs during the initialization process, including issues with creating
                     the database engine or verifying table creation.
         """
+        # imported lazily so the models are only loaded once a database connection is actually set up
+        from data.example.database.models import Base
+
+        if self.metadata is None:
+            self.metadata = Base.metadata
+
         try:
-            self.engine = create_engine(
-                f"{self.dialect}+{self.driver}://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
-            )
-            Base.metadata.create_all(self.engine)
-            with self.engine.connect() as connection:
-                created_tables = connection.execute(
-                    text(
-                        "select * from pg_catalog.pg_tables WHERE schemaname = 'public'"
-                    )
+            engine = self.engine
+            if engine is None:
+                engine = self.engine = get_engine(
+                    self.dialect,
+                    self.driver,
+                    self.username,
+                    self.password,
+                    self.host,
+                    self.port,
+                    self.database,
                 )
-                assert len(Base.metadata.tables) == len(
-                    created_tables.all()
-                ), "Error when generating tables"
+            # str(url) masks the password, which would merge DSNs that only differ in their credentials
+            engine_url = engine.url.render_as_string(hide_password=False)
+            fingerprint = get_metadata_fingerprint(Base.metadata)
+            if _verified_schemas.get(engine_url) == fingerprint:
+                return
+
+            Base.metadata.create_all(engine)
+            if get_bool_env("VALIDATE_SCHEMA", True):
+                created_tables = set(
+                    inspect(engine).get_table_names(schema="public")
+                )
+                missing_tables = set(Base.metadata.tables) - created_tables
+                assert (
+                    not missing_tables
+                ), f"Error when generating tables, missing: {sorted(missing_tables)}"
+            _verified_schemas[engine_url] = fingerprint
         except Exception as e:
             self.database_logger.error(f"Error when initializing DatabaseManager: {e}")
 
@@ -85,49 +237,226 @@ class DatabaseManager:
             data (list[dict[str, Any]]): A list of dictionaries where each dictionary represents a row of data to be inserted.
 
         Returns:
-            None or list[int]: If successful, returns a list of IDs for the inserted rows. Otherwise, returns None.
+            None or dict[str, int]: If successful, returns a dict mapping the inserted values to the ids. Otherwise, returns None.
         """
-        inspector = inspect(self.engine)
-
-        if not inspector.has_table(table_name):
-            self.database_logger.error(f"Table does not exist: {table_name}")
+        table = self.__get_table(table_name)
+        if table is None:
             return
 
-        table = Table(table_name, self.metadata, autoload_with=self.engine)
-        statement = table.insert().returning(table.c.id)
-
         with self.engine.begin() as connection:
-            result = connection.execute(statement, data)
-            values = [d[column_name].lower() for d in data]
-            ids = list(result.scalars().all())
-            self.database_logger.debug(f"values: {values}\nids: {ids}")
-            id_to_value_dict = dict(zip(values, ids))
-            self.database_logger.debug(f"id_to_value_dict: {id_to_value_dict}")
-
-            self.database_logger.debug(f"Inserted Rows: {result.rowcount}")
+            id_to_value_dict = self.__insert_dimension(
+                connection, table, column_name, data
+            )
 
         return id_to_value_dict
 
+    def insert_many_dimension_tables(
+        self, specs: list[tuple[str, str, list[dict[str, Any]]]]
+    ) -> None | dict[str, dict[str, int]]:
+        """
+        Inserts data into several dimension tables within a single transaction.
+
+        Args:
+            specs (list[tuple[str, str, list[dict[str, Any]]]]): The table name, the column later used as foreign key and the rows to insert for every table.
+
+        Returns:
+            None or dict[str, dict[str, int]]: If successful, returns a dict mapping every table name to its dict of inserted values and ids. Otherwise, returns None.
+        """
+        tables: list[Table] = []
+        for table_name, _, _ in specs:
+            table = self.__get_table(table_name)
+            if table is None:
+                return
+            tables.append(table)
+
+        dimension_ids: dict[str, dict[str, int]] = {}
+        with self.engine.begin() as connection:
+            for table, (table_name, column_name, data) in zip(tables, specs):
+                dimension_ids[table_name] = self.__insert_dimension(
+                    connection, table, column_name, data
+                )
+
+        return dimension_ids
+
     def insert_fact_table(self, table_name: str, data: DataFrame) -> None:
         """
         Inserts data into a fact table.
 
+        On PostgreSQL with psycopg2 the data is loaded with COPY, otherwise it falls back to `DataFrame.to_sql`
+        with multi-row INSERT statements of up to 1000 rows.
+
         Args:
             table_name (str): The name of the table.
             data (DataFrame): The data to insert.
         """
         with self.engine.begin() as connection:
-            data.to_sql(table_name, connection, index=False, if_exists="append")
+            if self.dialect == "postgresql" and self.driver == "psycopg2":
+                self.__copy_dataframe(connection, table_name, data)
+            else:
+                data.to_sql(
+                    table_name,
+                    connection,
+                    index=False,
+                    if_exists="append",
+                    method="multi",
+                    # keeps every multi-row INSERT below PostgreSQL's limit of 65535 bound parameters
+                    chunksize=max(1, min(1000, 65535 // max(1, len(data.columns)))),
+                )
+
+    def __get_table(self, table_name: str) -> None | Table:
+        """
+        Looks up a table in the metadata.
+        The ORM models already define every table, so no reflection round trips are needed.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            None or Table: The table if it exists. Otherwise, returns None.
+        """
+        table = self.metadata.tables.get(table_name)
+        if table is None:
+            self.database_logger.error(f"Table does not exist: {table_name}")
+        return table
+
+    def __insert_dimension(
+        self,
+        connection: Connection,
+        table: Table,
+        column_name: str,
+        data: list[dict[str, Any]],
+    ) -> dict[str, int]:
+        """
+        Inserts rows into a dimension table and maps the values to their ids.
+        Values that already exist in the table are not inserted again, their existing ids are reused.
+        Values that only differ in case are inserted once.
+        If no value is new, the insert is skipped.
+
+        Args:
+            connection (Connection): The connection of the surrounding transaction.
+            table (Table): The dimension table.
+            column_name (str): The name of the column later used as foreign key.
+            data (list[dict[str, Any]]): The rows to insert.
+
+        Returns:
+            dict[str, int]: A dict mapping the lowercased values to their ids.
+        """
+        if not data:
+            return {}
+
+        existing = connection.execute(select(table.c.id, table.c[column_name]))
+        id_to_value_dict = {
+            self.__get_dimension_key(value): dimension_id
+            for dimension_id, value in existing
+        }
+        # values differing only in case share one row, e.g. two categories "Male" and "male"
+        new_rows: dict[str, dict[str, Any]] = {}
+        for d in data:
+            key = self.__get_dimension_key(d[column_name])
+            if key not in id_to_value_dict:
+                new_rows.setdefault(key, d)
+        new_data = list(new_rows.values())
+        self.database_logger.debug(
+            f"Existing Rows: {len(id_to_value_dict)}, new Rows: {len(new_data)}"
+        )
+        if not new_data:
+            return id_to_value_dict
+
+        statement = table.insert().returning(table.c.id)
+        result = connection.execute(statement, new_data)
+        values = list(new_rows)
+        ids = list(result.scalars().all())
+        id_to_value_dict.update(zip(values, ids))
+        if self.database_logger.is_enabled_for("DEBUG"):
+            self.database_logger.debug(f"values: {values}\nids: {ids}")
+            self.database_logger.debug(f"id_to_value_dict: {id_to_value_dict}")
+
+        self.database_logger.debug(f"Inserted Rows: {result.rowcount}")
+        return id_to_value_dict
+
+    def __get_dimension_key(self, value: Any) -> str:
+        """
+        Converts a dimension value into the lowercased key used in the id dicts.
+
+        Enum columns return their members when selected, the database stores their names.
+
+        Args:
+            value (Any): The inserted or selected value.
+
+        Returns:
+            str: The lowercased name of an enum member or the lowercased value.
+        """
+        if isinstance(value, Enum):
+            return value.name.lower()
+        return str(value).lower()
+
+    def __cast_to_table_types(self, table_name: str, data: DataFrame) -> DataFrame:
+        """
+        Rounds decimal values that are loaded into integer columns.
+
+        COPY parses integer columns strictly and rejects values like "5.2", while an INSERT rounds them.
+        The values are rounded half away from zero like PostgreSQL rounds numeric values, missing values stay empty.
+
+        Args:
+            table_name (str): The name of the table.
+            data (DataFrame): The data to insert, its column names have to match the table columns.
+
+        Returns:
+            DataFrame: The data with integer values in all integer columns.
+        """
+        table = self.metadata.tables.get(table_name)
+        if table is None:
+            return data
+
+        casts = {
+            name: np.trunc(data[name] + np.copysign(0.5, data[name])).astype("Int64")
+            for name in data.columns
+            if name in table.c
+            and isinstance(table.c[name].type, Integer)
+            and is_float_dtype(data[name])
+        }
+        if casts:
+            self.database_logger.debug(f"Rounding integer columns: {list(casts)}")
+            data = data.assign(**casts)
+        return data
+
+    def __copy_dataframe(
+        self, connection: Connection, table_name: str, data: DataFrame
+    ) -> None:
+        """
+        Streams a DataFrame into a table using PostgreSQL's COPY.
+        The rows are sent in chunks of COPY_CHUNK_SIZE, so only one chunk is held in memory as CSV at a time.
+
+        Args:
+            connection (Connection): The connection of the surrounding transaction.
+            table_name (str): The name of the table.
+            data (DataFrame): The data to insert, its column names have to match the table columns.
+        """
+        data = self.__cast_to_table_types(table_name, data)
+        columns = ", ".join(f'"{column}"' for column in data.columns)
+        statement = f'COPY "{table_name}" ({columns}) FROM STDIN WITH (FORMAT CSV)'
+
+        with connection.connection.cursor() as cursor:
+            for start in range(0, len(data), COPY_CHUNK_SIZE):
+                buffer = io.StringIO()
+                data.iloc[start : start + COPY_CHUNK_SIZE].to_csv(
+                    buffer, index=False, header=False
+                )
+                buffer.seek(0)
+                cursor.copy_expert(statement, buffer)
+        self.database_logger.debug(f"Copied {len(data)} rows into {table_name}")
 
 
+@lru_cache(maxsize=1)
 def load_db_config() -> DatabaseManager:
     """
     Loads database configuration from environment variables and creates a `DatabaseManager` instance with the provided parameters.
+    The instance is created once and shared by all callers.
 
     Returns:
         DatabaseManager: A `DatabaseManager` object configured with the database details.
     """
-    load_dotenv()
+    ensure_env_loaded()
     database = os.getenv("EXAMPLE_DATABASE", "example_database")
     username = os.getenv("EXAMPLE_USERNAME", "username")
     password = os.getenv("EXAMPLE_PASSWORD", "password")
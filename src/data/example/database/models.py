@@ -1,5 +1,5 @@
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import Boolean, Double, ForeignKey, Integer, Text
+from sqlalchemy import Boolean, Double, ForeignKey, Index, Integer, Text, text
 from sqlalchemy import Enum as SQLEnum
 from ..utils.EGender import EGender
 from ..utils.EAcademicLevel import EAcademicLevel
@@ -21,6 +21,22 @@ class Student(Base):
     """
 
     __tablename__ = "students"
+    __table_args__ = (
+        Index("ix_students_gender_level", "gender_id", "academic_level_id"),
+        # includes the average daily usage, so the usage per country can be answered by an index only scan
+        Index(
+            "ix_students_country_mh",
+            "country_id",
+            "mental_health_score",
+            postgresql_include=["avg_daily_usage_hours"],
+        ),
+        Index(
+            "ix_students_affected_true",
+            "affects_academic_performance",
+            postgresql_where=text("affects_academic_performance"),
+        ),
+        Index("ix_students_conflicts", "conflicts_over_social_media"),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     gender_id: Mapped[int] = mapped_column(ForeignKey("genders.id"))
     academic_level_id: Mapped[int] = mapped_column(ForeignKey("academic_levels.id"))
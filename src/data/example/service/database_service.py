@@ -1,13 +1,12 @@
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any, Sequence
+from typing import Any, Callable
 
-from sqlalchemy import RowMapping, Select, Sequence, and_, select, func
+from sqlalchemy import CursorResult, Select, and_, select, func, tuple_
 from data.example.database.models import (
     AcademicLevel,
     Country,
     Gender,
-    Platform,
     Student,
 )
 from utils.logger.app_logger import ApplicationLogger
@@ -19,8 +18,47 @@ from data.example.utils.EPlatform import EPlatform
 from data.example.utils.ERelationshipStatus import ERelationshipStatus
 import numpy as np
 
+# maps the uppercased values of the dataset to the enum members, built once instead of per value
+GENDERS: dict[str, EGender] = {gender.value: gender for gender in EGender}
+PLATFORMS: dict[str, EPlatform] = {platform.value: platform for platform in EPlatform}
+# maps the uppercased values of the dataset to the names stored in the database
+ACADEMIC_LEVEL_NAMES: dict[str, str] = {
+    academic_level.value: academic_level.name for academic_level in EAcademicLevel
+}
+RELATIONSHIP_STATUS_NAMES: dict[str, str] = {
+    status.value: status.name for status in ERelationshipStatus
+}
+# streams large results through a server side cursor in batches of 1000 rows
+STREAM_OPTIONS: dict[str, Any] = {"yield_per": 1000}
+# columns of the dataset that are split off into dimension tables
+DIMENSION_COLUMNS: list[str] = [
+    "Gender",
+    "Academic_Level",
+    "Country",
+    "Most_Used_Platform",
+]
+# the student columns returned by the fetch methods joined with their dimension values
+BASE_STUDENT_QUERY: Select[Any] = (
+    select(
+        Student.id,
+        Student.relationship_status,
+        Student.age,
+        Student.affects_academic_performance,
+        Student.sleep_hours_per_night,
+        Student.mental_health_score,
+        Student.conflicts_over_social_media,
+        Student.addicted_score,
+        Gender.gender,
+        AcademicLevel.academic_level,
+        Country.country_name,
+    )
+    .join(Gender, Student.gender_id == Gender.id)
+    .join(AcademicLevel, Student.academic_level_id == AcademicLevel.id)
+    .join(Country, Student.country_id == Country.id)
+)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DatabaseService:
     """
     A class providing services for interacting with a database, including inserting various types of data.
@@ -33,16 +71,19 @@ class DatabaseService:
 
     Methods:
         - insert_data(df: pd.DataFrame) -> None: Inserts data from a DataFrame into the database.
-        - __insert_genders(table_name: str, genders: np.ndarray) -> None | list[int]: Inserts gender data into the specified table.
-        - __insert_academic_levels(table_name: str, academic_levels: np.ndarray) -> None | list[int]: Inserts academic level data into the database.
-        - __insert_countries(table_name: str, countries: np.ndarray) -> None | list[int]: Inserts country data into the database.
-        - __insert_platforms(table_name: str, platforms: np.ndarray) -> None | list[int]: Inserts platform data into the database.
+        - __prepare_genders(column_name: str, genders: np.ndarray) -> list[dict[str, Any]]: Prepares the rows of the gender table.
+        - __prepare_academic_levels(column_name: str, academic_levels: np.ndarray) -> list[dict[str, Any]]: Prepares the rows of the academic level table.
+        - __prepare_countries(column_name: str, countries: np.ndarray) -> list[dict[str, Any]]: Prepares the rows of the country table.
+        - __prepare_platforms(column_name: str, platforms: np.ndarray) -> list[dict[str, Any]]: Prepares the rows of the platform table.
         - __insert_students(table_name: str, df: pd.DataFrame) -> None: Inserts student data from a DataFrame into the database.
         - __prepare_foreign_keys(df: pd.DataFrame, gender_ids: None | dict[str, int], academic_level_ids: None | dict[str, int], country_ids: None | dict[str, int], platform_ids: None | dict[str, int]) -> pd.DataFrame: Prepares foreign keys for the DataFrame based on the provided dictionaries.
+        - __map_categories(column: pd.Series, ids: dict[str, int], normalize: Callable[[str], str]) -> np.ndarray: Maps a categorical column to ids by looking up every category once.
         - __prepare_relationship_status(df: pd.DataFrame, column_name: str) -> pd.DataFrame: Prepares the relationship status column in the DataFrame.
         - __prepare_column_names(df: pd.DataFrame) -> pd.DataFrame: Prepares the column names for the DataFrame by converting them to lowercase and dropping unnecessary columns.
+        - __to_dicts(result: CursorResult[Any]) -> list[dict[Any, Any]]: Converts the rows of a query result into dictionaries.
         - __get_base_student_query() -> Select[Any]: Get the base student query with joins to related tables.
         - fetch_by_gender_and_academic_level(gender: EGender, academic_level: EAcademicLevel) -> list[dict[Any, Any]]: Fetch students by gender and academic level.
+        - fetch_by_genders_and_academic_levels(keys: list[tuple[EGender, EAcademicLevel]]) -> dict[tuple[EGender, EAcademicLevel], list[dict[Any, Any]]]: Fetch students for several gender and academic level combinations in one query.
         - fetch_avg_daily_usage_for_country(country: str) -> Decimal | None: Fetch average daily usage for a specific country.
         - fetch_conflicts_over_threshold(threshold: int) -> list[dict[Any, Any]]: Fetch conflicts over a given threshold.
         - fetch_students_by_affected_flag(is_affected: bool) -> list[dict[Any, Any]]: Fetch students by their affected flag.
@@ -55,24 +96,56 @@ class DatabaseService:
     def insert_data(self, df: pd.DataFrame) -> None:
         """
         Inserts data from a DataFrame into the database.
+        All dimension tables are filled within a single transaction before the students are inserted.
 
         Args:
             df (pd.DataFrame): The DataFrame containing the data to be inserted.
         """
-        gender_ids = self.__insert_genders("genders", "gender", df["Gender"].unique())
-        self.logger.debug(f"gender_ids: {gender_ids}")
-        academic_level_ids = self.__insert_academic_levels(
-            "academic_levels", "academic_level", df["Academic_Level"].unique()
-        )
-        self.logger.debug(f"academic_level_ids: {academic_level_ids}")
-        country_ids = self.__insert_countries(
-            "countries", "country_name", df["Country"].unique()
-        )
-        self.logger.debug(f"country_ids: {country_ids}")
-        platform_ids = self.__insert_platforms(
-            "platforms", "platform", df["Most_Used_Platform"].unique()
+        # factorizes every dimension column once, its categories are the unique values
+        # and the foreign keys are looked up per category
+        df[DIMENSION_COLUMNS] = df[DIMENSION_COLUMNS].astype("category")
+        uniques = {
+            column: df[column].cat.categories.to_numpy() for column in DIMENSION_COLUMNS
+        }
+
+        dimension_ids = self.database_manager.insert_many_dimension_tables(
+            [
+                (
+                    "genders",
+                    "gender",
+                    self.__prepare_genders("gender", uniques["Gender"]),
+                ),
+                (
+                    "academic_levels",
+                    "academic_level",
+                    self.__prepare_academic_levels(
+                        "academic_level", uniques["Academic_Level"]
+                    ),
+                ),
+                (
+                    "countries",
+                    "country_name",
+                    self.__prepare_countries("country_name", uniques["Country"]),
+                ),
+                (
+                    "platforms",
+                    "platform",
+                    self.__prepare_platforms("platform", uniques["Most_Used_Platform"]),
+                ),
+            ]
         )
-        self.logger.debug(f"platform_ids: {platform_ids}")
+        if dimension_ids is None:
+            dimension_ids = {}
+
+        gender_ids = dimension_ids.get("genders")
+        academic_level_ids = dimension_ids.get("academic_levels")
+        country_ids = dimension_ids.get("countries")
+        platform_ids = dimension_ids.get("platforms")
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(f"gender_ids: {gender_ids}")
+            self.logger.debug(f"academic_level_ids: {academic_level_ids}")
+            self.logger.debug(f"country_ids: {country_ids}")
+            self.logger.debug(f"platform_ids: {platform_ids}")
 
         self.__insert_students(
             "students", df, gender_ids, academic_level_ids, country_ids, platform_ids
@@ -101,11 +174,40 @@ class DatabaseService:
             )
 
             self.logger.debug(
-                f"Executing query for gender={gender}, academic_level={academic_level}"
+                "Executing query for gender={}, academic_level={}",
+                gender,
+                academic_level,
+            )
+            results = self.__to_dicts(connection.execute(query))
+
+        return results
+
+    def fetch_by_genders_and_academic_levels(
+        self, keys: list[tuple[EGender, EAcademicLevel]]
+    ) -> dict[tuple[EGender, EAcademicLevel], list[dict[Any, Any]]]:
+        """
+        Fetch students for several gender and academic level combinations in one query.
+
+        Args:
+            keys (list[tuple[EGender, EAcademicLevel]]): The combinations of gender and academic level to fetch.
+
+        Returns:
+            dict[tuple[EGender, EAcademicLevel], list[dict[Any, Any]]]: The fetched students grouped by their combination, every key is present.
+        """
+        students: dict[tuple[EGender, EAcademicLevel], list[dict[Any, Any]]] = {
+            key: [] for key in keys
+        }
+        with self.database_manager.engine.begin() as connection:
+            query = self.__get_base_student_query().where(
+                tuple_(Gender.gender, AcademicLevel.academic_level).in_(keys)
             )
-            results = connection.execute(query).mappings().all()
 
-        return [dict(result) for result in results]
+            self.logger.debug("Executing query for {} gender and level keys", len(keys))
+            results = self.__to_dicts(connection.execute(query))
+
+        for result in results:
+            students[(result["gender"], result["academic_level"])].append(result)
+        return students
 
     def fetch_avg_daily_usage_for_country(self, country: str) -> Decimal | None:
         """
@@ -123,7 +225,7 @@ class DatabaseService:
                 .join(Country, Student.country_id == Country.id)
                 .where(Country.country_name == country)
             )
-            self.logger.debug(f"Executing query for country: {country}")
+            self.logger.debug("Executing query for country: {}", country)
             result = connection.execute(query).fetchone()
             value: Decimal | None = result[0] if result else None
         return value
@@ -142,10 +244,12 @@ class DatabaseService:
             query = self.__get_base_student_query().where(
                 Student.conflicts_over_social_media > threshold
             )
-            self.logger.debug(f"Executing query for threshold: {threshold}")
-            results = connection.execute(query).mappings().all()
+            self.logger.debug("Executing query for threshold: {}", threshold)
+            results = self.__to_dicts(
+                connection.execute(query, execution_options=STREAM_OPTIONS)
+            )
 
-        return [dict(result) for result in results]
+        return results
 
     def fetch_students_by_affected_flag(
         self, is_affected: bool
@@ -163,9 +267,11 @@ class DatabaseService:
             query = self.__get_base_student_query().where(
                 Student.affects_academic_performance == is_affected
             )
-            self.logger.debug(f"Executing query for is_affected: {is_affected}")
-            results = connection.execute(query).mappings().all()
-        return [dict(result) for result in results]
+            self.logger.debug("Executing query for is_affected: {}", is_affected)
+            results = self.__to_dicts(
+                connection.execute(query, execution_options=STREAM_OPTIONS)
+            )
+        return results
 
     def fetch_students_by_country_and_mental_health(
         self, country: str, mental_health: int
@@ -188,101 +294,87 @@ class DatabaseService:
                 )
             )
             self.logger.debug(
-                f"Executing query for country: {country} and mental health score: {mental_health}"
+                "Executing query for country: {} and mental health score: {}",
+                country,
+                mental_health,
             )
-            results = connection.execute(query).mappings().all()
-        return [dict(result) for result in results]
+            results = self.__to_dicts(connection.execute(query))
+        return results
 
-    def __insert_genders(
-        self, table_name: str, column_name: str, genders: np.ndarray
-    ) -> None | dict[str, int]:
+    def __prepare_genders(
+        self, column_name: str, genders: np.ndarray
+    ) -> list[dict[str, Any]]:
         """
-        Inserts gender data into the specified table.
+        Prepares the rows of the gender table.
 
         Args:
-            table_name (str): The name of the table to insert data into.
             column_name (str): The name of the column later used as foreign key.
             genders (np.ndarray): An array containing unique gender values.
 
         Returns:
-            None or dict[str, int]: If successful, returns a dict mapping the inserted values to the ids. Otherwise, returns None.
+            list[dict[str, Any]]: The rows to insert into the gender table.
         """
-        data = [{column_name: EGender(gender.upper()).value} for gender in genders]
-        self.logger.debug(f"data: {data}")
-        gender_ids = self.database_manager.insert_dimension_tables(
-            table_name, column_name, data
-        )
-
-        return gender_ids
-
-    def __insert_academic_levels(
-        self, table_name: str, column_name: str, academic_levels: np.ndarray
-    ) -> None | dict[str, int]:
+        data = [{column_name: GENDERS[gender.upper()].value} for gender in genders]
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(f"data: {data}")
+        return data
+
+    def __prepare_academic_levels(
+        self, column_name: str, academic_levels: np.ndarray
+    ) -> list[dict[str, Any]]:
         """
-        Inserts academic level data into the database.
+        Prepares the rows of the academic level table.
 
         Args:
-            table_name (str): The name of the table to insert data into.
             column_name (str): The name of the column later used as foreign key.
             academic_levels (np.ndarray): An array containing unique academic level values.
 
         Returns:
-            None or dict[str, int]: If successful, returns a dict mapping the inserted values to the ids. Otherwise, returns None.
+            list[dict[str, Any]]: The rows to insert into the academic level table.
         """
         data = [
-            {column_name: EAcademicLevel(academic_level.upper()).name}
+            {column_name: ACADEMIC_LEVEL_NAMES[academic_level.upper()]}
             for academic_level in academic_levels
         ]
-        self.logger.debug(f"data: {data}")
-        academic_level_ids = self.database_manager.insert_dimension_tables(
-            table_name, column_name, data
-        )
-
-        return academic_level_ids
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(f"data: {data}")
+        return data
 
-    def __insert_countries(
-        self, table_name: str, column_name: str, countries: np.ndarray
-    ) -> None | dict[str, int]:
+    def __prepare_countries(
+        self, column_name: str, countries: np.ndarray
+    ) -> list[dict[str, Any]]:
         """
-        Inserts country data into the database.
+        Prepares the rows of the country table.
 
         Args:
-            table_name (str): The name of the table to insert data into.
             column_name (str): The name of the column later used as foreign key.
             countries (np.ndarray): An array containing unique country values.
 
         Returns:
-            None or dict[str, int]: If successful, returns a dict mapping the inserted values to the ids. Otherwise, returns None.
+            list[dict[str, Any]]: The rows to insert into the country table.
         """
-        data = [{"country_name": country} for country in countries]
-        self.logger.debug(f"data: {data}")
-        country_ids = self.database_manager.insert_dimension_tables(
-            table_name, column_name, data
-        )
-
-        return country_ids
-
-    def __insert_platforms(
-        self, table_name: str, column_name: str, platforms: np.ndarray
-    ) -> None | dict[str, int]:
+        data = [{column_name: country} for country in countries]
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(f"data: {data}")
+        return data
+
+    def __prepare_platforms(
+        self, column_name: str, platforms: np.ndarray
+    ) -> list[dict[str, Any]]:
         """
-        Inserts platform data into the database.
+        Prepares the rows of the platform table.
 
         Args:
-            table_name (str): The name of the table to insert data into.
             column_name (str): The name of the column later used as foreign key.
             platforms (np.ndarray): An array containing unique platform values.
 
         Returns:
-            None or dict[str, int]: If successful, returns a dict mapping the inserted values to the ids. Otherwise, returns None.
+            list[dict[str, Any]]: The rows to insert into the platform table.
         """
-        data = [{column_name: EPlatform(platform.upper())} for platform in platforms]
-        self.logger.debug(f"data: {data}")
-        platform_ids = self.database_manager.insert_dimension_tables(
-            table_name, column_name, data
-        )
-
-        return platform_ids
+        data = [{column_name: PLATFORMS[platform.upper()]} for platform in platforms]
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(f"data: {data}")
+        return data
 
     def __insert_students(
         self,
@@ -333,23 +425,56 @@ class DatabaseService:
             pd.DataFrame: The prepared DataFrame with foreign keys added.
         """
         if gender_ids and academic_level_ids and country_ids and platform_ids:
-            df["gender_id"] = [gender_ids[str_val.lower()] for str_val in df["Gender"]]
-            df["country_id"] = [
-                country_ids[str_val.lower()] for str_val in df["Country"]
-            ]
-            df["platform_id"] = [
-                platform_ids[str_val.lower()] for str_val in df["Most_Used_Platform"]
-            ]
-            df["academic_level_id"] = [
-                (
-                    academic_level_ids[str_val.lower()]
-                    if str_val.count(" ") < 1
-                    else academic_level_ids[str_val.replace(" ", "_").lower()]
-                )
-                for str_val in df["Academic_Level"]
-            ]
+            df["gender_id"] = self.__map_categories(df["Gender"], gender_ids, str.lower)
+            df["country_id"] = self.__map_categories(
+                df["Country"], country_ids, str.lower
+            )
+            df["platform_id"] = self.__map_categories(
+                df["Most_Used_Platform"], platform_ids, str.lower
+            )
+            # the academic level table stores the enum names, e.g. "High School" -> "high_school"
+            df["academic_level_id"] = self.__map_categories(
+                df["Academic_Level"],
+                academic_level_ids,
+                lambda academic_level: ACADEMIC_LEVEL_NAMES[
+                    academic_level.upper()
+                ].lower(),
+            )
         return df
 
+    def __map_categories(
+        self,
+        column: pd.Series,
+        ids: dict[str, int],
+        normalize: Callable[[str], str],
+    ) -> np.ndarray:
+        """
+        Maps a categorical column to ids by looking up every category once and gathering the result by the category codes.
+
+        Args:
+            column (pd.Series): The categorical column to map.
+            ids (dict[str, int]): A dictionary mapping the normalized values to IDs.
+            normalize (Callable[[str], str]): Converts a category into the key used in `ids`.
+
+        Raises:
+            ValueError: If the column contains missing values.
+
+        Returns:
+            np.ndarray: The id of every row.
+        """
+        categories = column.cat.categories
+        codes = column.cat.codes.to_numpy()
+        if (codes < 0).any():
+            raise ValueError(f"Column {column.name} contains missing values")
+
+        # the id columns are 32 bit integers, which halves the size of the gathered column
+        lookup = np.fromiter(
+            (ids[normalize(category)] for category in categories),
+            dtype=np.int32,
+            count=len(categories),
+        )
+        return lookup[codes]
+
     def __prepare_relationship_status(
         self, df: pd.DataFrame, column_name: str
     ) -> pd.DataFrame:
@@ -360,13 +485,20 @@ class DatabaseService:
             df (pd.DataFrame): The DataFrame to prepare.
             column_name (str): The name of the column containing relationship statuses.
 
+        Raises:
+            ValueError: If the column contains unknown relationship statuses.
+
         Returns:
             pd.DataFrame: The prepared DataFrame with relationship status names converted to uppercase and renamed.
         """
-        df[column_name] = [
-            ERelationshipStatus(relationship_status.upper()).name
-            for relationship_status in df[column_name]
-        ]
+        names = df[column_name].str.upper().map(RELATIONSHIP_STATUS_NAMES)
+        unmapped = names.isna()
+        if unmapped.any():
+            raise ValueError(
+                f"Column {column_name} contains unknown relationship statuses: "
+                f"{df.loc[unmapped, column_name].unique().tolist()}"
+            )
+        df[column_name] = names
         return df
 
     def __prepare_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -379,36 +511,32 @@ class DatabaseService:
         Returns:
             pd.DataFrame: The prepared DataFrame with lowercased column names and dropped unnecessary columns.
         """
-        df = df.drop(
-            columns=["Gender", "Country", "Most_Used_Platform", "Academic_Level"]
-        )
-        columns = {column: column.lower() for column in df.columns}
-        df.rename(columns=columns, inplace=True)
+        df = df.drop(columns=DIMENSION_COLUMNS)
+        # relabels the columns without another pass over the data
+        df.columns = df.columns.str.lower()
         return df
 
+    def __to_dicts(self, result: CursorResult[Any]) -> list[dict[Any, Any]]:
+        """
+        Converts the rows of a query result into dictionaries.
+        The rows are fetched as plain tuples and zipped with the column names, which are read once per result.
+        Streamed results are consumed batch by batch.
+
+        Args:
+            result (CursorResult[Any]): The result of an executed query.
+
+        Returns:
+            list[dict[Any, Any]]: List of dictionaries mapping the column names to the row values.
+        """
+        keys = tuple(result.keys())
+        return [dict(zip(keys, row)) for row in result.tuples()]
+
     def __get_base_student_query(self) -> Select[Any]:
         """
         Get the base student query with joins to related tables.
+        The statement is built once at module load, filters are added generatively and don't modify it.
 
         Returns:
             Select[Any]: A SQLAlchemy select statement for fetching student data.
         """
-        return (
-            select(
-                Student.id,
-                Student.relationship_status,
-                Student.age,
-                Student.affects_academic_performance,
-                Student.sleep_hours_per_night,
-                Student.mental_health_score,
-                Student.conflicts_over_social_media,
-                Student.addicted_score,
-                Gender.gender,
-                AcademicLevel.academic_level,
-                Country.country_name,
-            )
-            .join(Gender, Student.gender_id == Gender.id)
-            .join(AcademicLevel, Student.academic_level_id == AcademicLevel.id)
-            .join(Country, Student.country_id == Country.id)
-            .join(Platform, Student.platform_id == Platform.id)
-        )
+        return BASE_STUDENT_QUERY
@@ -1,8 +1,31 @@
+from contextlib import asynccontextmanager
+import os
 from fastapi import FastAPI
+from sqlalchemy.orm import configure_mappers
 import uvicorn
 from data.api.example_routes import router
+from data.example.database.database_manager import load_db_config, warm_up_pool
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Configures all ORM mappers and fills the connection pool on startup so the first requests do not pay for it.
+
+    Args:
+        app (FastAPI): The application that is starting up.
+    """
+    configure_mappers()
+    database_manager = load_db_config()
+    if database_manager.engine is not None:
+        warm_up_pool(database_manager.engine, int(os.getenv("SQLA_POOL_SIZE", "10")))
+    yield
+
+
+app = FastAPI(
+    lifespan=lifespan,
+    openapi_url=None if os.getenv("ENV") == "prod" else "/openapi.json",
+)
 app.include_router(router)
 
 if __name__ == "__main__":
@@ -24,10 +24,10 @@ async def execute_prompt(
     Returns:
         None
     """
-    api_logger.debug(f"/prompt endpoint called with request: {request}")
+    api_logger.debug("/prompt endpoint called with request: {}", request)
     prompt = api_controller.build_final_prompt(request.prompt, request.template_name)
-    response = api_controller.run_prompt(prompt)
-    api_logger.debug(f"Prompt execution finished")
+    response = await api_controller.arun_prompt(prompt)
+    api_logger.debug("Prompt execution finished")
 
     extracted = ""
     try:
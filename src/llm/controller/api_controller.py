@@ -1,29 +1,29 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Iterator
 from llm.service.api_service import ApiService
 from utils.logger.app_logger import ApplicationLogger
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApiControlller:
     """
     A class for managing API requests and handling prompts.
 
     Attributes:
-        template_dict (dict[str, str]): A dictionary of template names to their file paths.
-            Defaults to a lambda function that returns `{"example": "example.txt"}`.
         api_service (ApiService): An instance of the ApiService class used for building and running prompts.
             Defaults to a lambda function that returns an instance of ApiService.
 
     Methods:
         build_final_prompt(prompt: str, template_name: str) -> str:
             Builds the final prompt by combining the input prompt with the specified template.
-        run_prompt(prompt: str) -> None: Runs the provided prompt using the api_service.
-        extract_json(text: str) -> str: Extracts JSON from a text string by removing any surrounding code blocks or syntax.
+        stream_prompt(prompt: str) -> Iterator[str]: Runs the provided prompt using the api_service and yields the response.
+        run_prompt(prompt: str) -> str: Runs the provided prompt using the api_service.
+        arun_prompt(prompt: str) -> str: Runs the provided prompt asynchronously using the api_service.
+        arun_prompts(prompts: list[str]) -> list[str]: Runs several prompts concurrently using the api_service.
+        extract_json(text: str) -> Any: Extracts JSON from a text string by removing any surrounding code blocks or syntax and parses it.
     """
 
-    template_dict: dict[str, str] = field(
-        default_factory=lambda: {"example": "example.txt"}
-    )
     api_service: ApiService = field(default_factory=lambda: ApiService())
 
     def build_final_prompt(self, prompt: str, template_name: str) -> str:
@@ -39,33 +39,76 @@ class ApiControlller:
         """
         return self.api_service.build_final_prompt(prompt, template_name)
 
+    def stream_prompt(self, prompt: str) -> Iterator[str]:
+        """
+        Runs the provided prompt using the api_service and yields the response while it is generated.
+
+        Args:
+            prompt (str): The prompt to be run.
+
+        Returns:
+            Iterator[str]: The chunks of the response.
+        """
+        return self.api_service.stream_prompt(prompt)
+
     def run_prompt(self, prompt: str) -> str:
         """
         Runs the provided prompt using the api_service.
 
         Args:
             prompt (str): The prompt to be run.
+
+        Returns:
+            str: The full response of the chat model.
         """
         return self.api_service.run_prompt(prompt)
 
-    def extract_json(self, text: str) -> str:
+    async def arun_prompt(self, prompt: str) -> str:
+        """
+        Runs the provided prompt asynchronously using the api_service.
+
+        Args:
+            prompt (str): The prompt to be run.
+
+        Returns:
+            str: The full response of the chat model.
         """
-        Extracts JSON from a text string by removing any surrounding code blocks or syntax.
+        return await self.api_service.arun_prompt(prompt)
+
+    async def arun_prompts(self, prompts: list[str]) -> list[str]:
+        """
+        Runs several prompts concurrently using the api_service.
+
+        Args:
+            prompts (list[str]): The prompts to be run.
+
+        Returns:
+            list[str]: The full responses of the chat model in the order of the prompts.
+        """
+        return await self.api_service.arun_prompts(prompts)
+
+    def extract_json(self, text: str) -> Any:
+        """
+        Extracts JSON from a text string by removing any surrounding code blocks or syntax and parses it.
 
         Args:
             text (str): The text string containing JSON data.
 
+        Raises:
+            ValueError: If the extracted text is not valid JSON.
+
         Returns:
-            str: The extracted JSON data as a string.
+            Any: The parsed JSON data.
         """
         return self.api_service.extract_json(text)
 
 
+@lru_cache(maxsize=1)
 def get_api_controller() -> ApiControlller:
     """
-    Returns a new instance of ApiControlller.
+    Returns the shared instance of ApiControlller.
 
     Returns:
-        ApiControlller: A new instance of ApiControlller with default values for its attributes.
+        ApiControlller: The instance of ApiControlller with default values for its attributes, created on the first call.
     """
     return ApiControlller()
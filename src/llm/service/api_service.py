@@ -1,31 +1,90 @@
+import asyncio
 from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, AsyncIterator, ClassVar, Iterator
 from utils.logger.app_logger import ApplicationLogger
-import os
+from utils.token_writer import TokenWriter
+from utils.env import ensure_env_loaded
 from pathlib import Path
 from string import Template
-from ollama import chat
-import re
-import json
+from ollama import AsyncClient, Client
+import os
+import weakref
+import orjson
+
+ensure_env_loaded()
+
+MODEL = "qwen2.5-coder:7b"
+OPTIONS = {
+    "num_thread": int(os.getenv("OLLAMA_NUM_THREAD", "4")),
+    "num_flash_attn": True,
+    "num_batch": int(os.getenv("OLLAMA_NUM_BATCH", "128")),
+    "num_ctx": int(os.getenv("OLLAMA_NUM_CTX", "4096")),
+    "f16_kv": True,
+}
+# how long ollama keeps the model loaded after a prompt, so following prompts don't wait for it to reload
+KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+
+@lru_cache(maxsize=1)
+def get_client() -> Client:
+    """
+    Returns the ollama client shared by the process, so its HTTP connections are kept alive between prompts.
+
+    Returns:
+        Client: The shared synchronous ollama client.
+    """
+    return Client()
+
+
+# the connections of an async client are bound to the event loop they were opened in,
+# so every loop gets its own client that is dropped together with the loop
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
 
 
-@dataclass
+def get_async_client() -> AsyncClient:
+    """
+    Returns the asynchronous ollama client of the running event loop, so its HTTP connections are kept alive between prompts.
+
+    Returns:
+        AsyncClient: The asynchronous ollama client shared by the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = AsyncClient()
+    return client
+
+
+@dataclass(slots=True, frozen=True)
 class ApiService:
     """API service for handling prompts and running them.
 
     Attributes:
         api_logger (ApplicationLogger): Logger for API operations
+        _template_cache (dict[str, tuple[float, Template]]): The parsed templates by name, reloaded when their file changes.
 
     Methods:
         build_final_prompt(prompt: str, template_name: str) -> str: Builds the final prompt using a specified template.
-        run_prompt(prompt: str) -> None: Runs the given prompt through a chat model and prints the response.
-        extract_json(text: str) -> str: Extracts JSON from a text string by removing any surrounding code blocks or syntax.
+        stream_prompt(prompt: str) -> Iterator[str]: Runs the given prompt through a chat model and yields the response chunks.
+        astream_prompt(prompt: str) -> AsyncIterator[str]: Runs the given prompt through a chat model without blocking the event loop and yields the response chunks.
+        run_prompt(prompt: str, echo: bool = True) -> str: Runs the given prompt through a chat model and prints the response.
+        arun_prompt(prompt: str, echo: bool = True) -> str: Runs the given prompt through a chat model without blocking the event loop.
+        arun_prompts(prompts: list[str]) -> list[str]: Runs several prompts through a chat model concurrently.
+        extract_json(text: str) -> Any: Extracts JSON from a text string by removing any surrounding code blocks or syntax and parses it.
     """
 
     api_logger: ApplicationLogger = field(default_factory=lambda: ApplicationLogger())
+    # parsed templates by name with the modification time of their file, shared by all instances
+    _template_cache: ClassVar[dict[str, tuple[float, Template]]] = {}
 
     def build_final_prompt(self, prompt: str, template_name: str) -> str:
         """Builds the final prompt by substituting the template with the provided prompt.
 
+        Templates are parsed once and reused until their file is modified.
+
         Args:
             prompt (str): The input prompt to be substituted.
             template_name (str): The name of the template file.
@@ -34,66 +93,159 @@ class ApiService:
             str: The final prompt after substitution.
 
         Raises:
-            AssertionError: If the template does not exist in the templates directory.
+            FileNotFoundError: If the template does not exist in the templates directory.
         """
         file_path = Path(f"templates/{template_name}.txt")
 
         try:
-            assert os.path.exists(
-                file_path
-            ), f"Error {template_name} does not exists in {Path('templates/')}"
-        except AssertionError as e:
-            error_msg = f"Error when building final prompt template: {e}"
+            modified_at = file_path.stat().st_mtime
+        except FileNotFoundError as e:
+            error_msg = f"Error when building final prompt template: Error {template_name} does not exists in {Path('templates/')}"
             self.api_logger.error(error_msg)
-            raise AssertionError(error_msg)
+            raise FileNotFoundError(error_msg) from e
 
-        with open(file_path) as file:
-            template = Template("\n".join(file.readlines()))
-            prompt = template.safe_substitute(prompt=prompt)
+        cached = ApiService._template_cache.get(template_name)
+        if cached is None or cached[0] != modified_at:
+            template = Template(file_path.read_text(encoding="utf-8"))
+            ApiService._template_cache[template_name] = (modified_at, template)
+        else:
+            template = cached[1]
+        prompt = template.safe_substitute(prompt=prompt)
 
         self.api_logger.debug("Fetched prompt tempate and injected the prompt")
 
         return prompt
 
-    def run_prompt(self, prompt: str) -> str:
-        """Runs the provided prompt through a chat model.
+    def stream_prompt(self, prompt: str) -> Iterator[str]:
+        """Runs the provided prompt through a chat model and yields the response while it is generated.
 
         Args:
             prompt (str): The prompt to be sent to the chat model.
+
+        Yields:
+            str: The non-empty chunks of the response.
         """
-        ret = ""
         self.api_logger.debug("Running prompt")
-        response = chat(
-            model="qwen2.5-coder:7b",
+        response = get_client().chat(
+            model=MODEL,
             messages=[{"role": "user", "content": prompt}],
             stream=True,
-            options={
-                "num_thread": 4,
-                "num_flash_attn": True,
-                "num_batch": 128,
-                "num_ctx": 4096,
-                "f16_kv": True,
-            },
+            options=OPTIONS,
+            keep_alive=KEEP_ALIVE,
         )
         for chunk in response:
             msg_chunk = chunk.message.content
-            if type(msg_chunk) == str:
-                ret += msg_chunk
-            print(msg_chunk, end="", flush=True)
-        print("\n")
-        return ret
+            if msg_chunk:
+                yield msg_chunk
+
+    async def astream_prompt(self, prompt: str) -> AsyncIterator[str]:
+        """Runs the provided prompt through a chat model using the asynchronous ollama client and yields the response while it is generated.
 
-    def extract_json(self, text: str) -> str:
+        Args:
+            prompt (str): The prompt to be sent to the chat model.
+
+        Yields:
+            str: The non-empty chunks of the response.
         """
-        Extracts JSON from a text string by removing any surrounding code blocks or syntax.
+        self.api_logger.debug("Running prompt")
+        response = await get_async_client().chat(
+            model=MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            stream=True,
+            options=OPTIONS,
+            keep_alive=KEEP_ALIVE,
+        )
+        async for chunk in response:
+            msg_chunk = chunk.message.content
+            if msg_chunk:
+                yield msg_chunk
+
+    def run_prompt(self, prompt: str, echo: bool = True) -> str:
+        """Runs the provided prompt through a chat model.
 
         Args:
-            text (str): The text string containing JSON data.
+            prompt (str): The prompt to be sent to the chat model.
+            echo (bool, optional): Whether the streamed response is printed. Defaults to True.
+
+        Returns:
+            str: The full response of the chat model.
+        """
+        chunks: list[str] = []
+        writer = TokenWriter() if echo else None
+        for msg_chunk in self.stream_prompt(prompt):
+            chunks.append(msg_chunk)
+            if writer:
+                writer.write(msg_chunk)
+        if writer:
+            writer.write("\n\n")
+            writer.flush()
+        return "".join(chunks)
+
+    async def arun_prompt(self, prompt: str, echo: bool = True) -> str:
+        """Runs the provided prompt through a chat model using the asynchronous ollama client.
+
+        The response is streamed, so the event loop stays free while the model is generating.
+
+        Args:
+            prompt (str): The prompt to be sent to the chat model.
+            echo (bool, optional): Whether the streamed response is printed. Defaults to True.
+
+        Returns:
+            str: The full response of the chat model.
+        """
+        chunks: list[str] = []
+        writer = TokenWriter() if echo else None
+        async for msg_chunk in self.astream_prompt(prompt):
+            chunks.append(msg_chunk)
+            if writer:
+                writer.write(msg_chunk)
+        if writer:
+            writer.write("\n\n")
+            writer.flush()
+        return "".join(chunks)
+
+    async def arun_prompts(self, prompts: list[str]) -> list[str]:
+        """Runs several prompts through a chat model concurrently.
+
+        All requests are in flight at once, so the ollama server can schedule them together
+        instead of processing one prompt after the other. The streamed responses are not printed
+        as they would interleave.
+
+        Args:
+            prompts (list[str]): The prompts to be sent to the chat model.
 
         Returns:
-            str: The extracted JSON data as a string.
+            list[str]: The full responses of the chat model in the order of the prompts.
         """
-        cleaned = re.sub(
-            r"^```(?:json)?\s*|\s*```$", "", text.strip(), flags=re.IGNORECASE
+        return list(
+            await asyncio.gather(
+                *(self.arun_prompt(prompt, echo=False) for prompt in prompts)
+            )
         )
-        return json.loads(cleaned)
+
+    def extract_json(self, text: str) -> Any:
+        """
+        Extracts JSON from a text string by removing any surrounding code blocks or syntax and parses it.
+
+        Args:
+            text (str): The text string containing JSON data.
+
+        Raises:
+            ValueError: If the extracted text is not valid JSON.
+
+        Returns:
+            Any: The parsed JSON data.
+        """
+        cleaned = text.strip()
+        if cleaned.startswith("```"):
+            # drops the opening fence including an optional json language tag
+            newline = cleaned.find("\n")
+            if newline != -1 and cleaned[3:newline].strip().lower() in ("", "json"):
+                cleaned = cleaned[newline + 1 :]
+            else:
+                cleaned = cleaned[3:]
+                if cleaned[:4].lower() == "json":
+                    cleaned = cleaned[4:]
+        if cleaned.endswith("```"):
+            cleaned = cleaned[:-3]
+        return orjson.loads(cleaned.strip())
@@ -0,0 +1,94 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable
+from fastapi.concurrency import run_in_threadpool
+
+
+@dataclass
+class BatchedFetcher:
+    """
+    Coalesces concurrent lookups into a single call of a bulk fetch function.
+
+    Keys submitted within `max_wait_ms` of each other (or until `max_batch_size` keys are pending)
+    are deduplicated and handed to `fetch_many` at once. Its result is split back to the waiting callers.
+
+    Attributes:
+        fetch_many (Callable[[list[Any]], dict[Any, Any]]): A blocking function returning a result for every given key, run in the threadpool.
+        max_batch_size (int): The number of pending keys that triggers an immediate fetch. Defaults to 32.
+        max_wait_ms (float): The time in milliseconds a key waits for other keys to join its batch. Defaults to 20.
+
+    Methods:
+        submit(key: Hashable) -> Any: Queues a key for the next batch and returns its result.
+        __flush() -> None: Starts fetching all pending keys.
+        __fetch(batch: list[tuple[Hashable, asyncio.Future[Any]]]) -> None: Fetches a batch and resolves its futures.
+    """
+
+    fetch_many: Callable[[list[Any]], dict[Any, Any]]
+    max_batch_size: int = 32
+    max_wait_ms: float = 20
+    _pending: list[tuple[Hashable, asyncio.Future[Any]]] = field(
+        default_factory=list, init=False
+    )
+    _timer: asyncio.TimerHandle | None = field(default=None, init=False)
+    _tasks: set[asyncio.Task[None]] = field(default_factory=set, init=False)
+
+    async def submit(self, key: Hashable) -> Any:
+        """
+        Queues a key for the next batch and returns its result.
+
+        Args:
+            key (Hashable): The key to fetch.
+
+        Returns:
+            Any: The result `fetch_many` returned for the key.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.append((key, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self.__flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self.__flush)
+
+        return await future
+
+    def __flush(self) -> None:
+        """
+        Starts fetching all pending keys.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self.__fetch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def __fetch(self, batch: list[tuple[Hashable, asyncio.Future[Any]]]) -> None:
+        """
+        Fetches a batch and resolves its futures.
+
+        Every future is resolved, a failed fetch or a key missing from the result is raised to its callers.
+
+        Args:
+            batch (list[tuple[Hashable, asyncio.Future[Any]]]): The pending keys and the futures of their callers.
+        """
+        keys = list(dict.fromkeys(key for key, _ in batch))
+        try:
+            results = await run_in_threadpool(self.fetch_many, keys)
+            for key, future in batch:
+                if future.done():
+                    continue
+                if key in results:
+                    future.set_result(results[key])
+                else:
+                    future.set_exception(KeyError(key))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
@@ -0,0 +1,28 @@
+import os
+from functools import lru_cache
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=1)
+def ensure_env_loaded() -> None:
+    """
+    Loads the .env file into the environment, only reading it on the first call of the process.
+    """
+    load_dotenv()
+
+
+def get_bool_env(name: str, default: bool) -> bool:
+    """
+    Reads a boolean flag from the environment.
+
+    Args:
+        name (str): The name of the environment variable.
+        default (bool): The value used if the variable is not set.
+
+    Returns:
+        bool: True if the variable is set to 1, true or yes (case insensitive), otherwise False.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes"}
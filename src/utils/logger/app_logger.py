@@ -1,6 +1,8 @@
 from typing import Any
 from loguru import logger as loguru_logger
+import os
 import sys
+from utils.env import ensure_env_loaded
 
 
 class ApplicationLogger:
@@ -10,20 +12,31 @@ class ApplicationLogger:
     Attributes:
         _instance (ApplicationLogger): The singleton instance of ApplicationLogger.
         _initialized (bool): Indicates whether the logger has been initialized.
+        level_no (int): The severity number of the minimum level that is logged, configured through LOG_LEVEL.
 
     Methods:
-        trace(msg: str) -> None: Logs a message with severity 'TRACE'.
-        debug(msg: str) -> None: Logs a message with severity 'DEBUG'.
-        info(msg: str) -> None: Logs a message with severity 'INFO'.
-        success(msg: str) -> None: Logs a message with severity 'SUCCESS'.
-        warning(msg: str) -> None: Logs a message with severity 'WARNING'.
-        error(msg: str) -> None: Logs a message with severity 'ERROR'.
-        critical(msg: str) -> None: Logs a message with severity 'CRITICAL'.
+        is_enabled_for(level: str) -> bool: Checks whether messages of a level are logged.
+        trace(msg: str, *args: Any, **kwargs: Any) -> None: Logs a message with severity 'TRACE'.
+        debug(msg: str, *args: Any, **kwargs: Any) -> None: Logs a message with severity 'DEBUG'.
+        info(msg: str, *args: Any, **kwargs: Any) -> None: Logs a message with severity 'INFO'.
+        success(msg: str, *args: Any, **kwargs: Any) -> None: Logs a message with severity 'SUCCESS'.
+        warning(msg: str, *args: Any, **kwargs: Any) -> None: Logs a message with severity 'WARNING'.
+        error(msg: str, *args: Any, **kwargs: Any) -> None: Logs a message with severity 'ERROR'.
+        critical(msg: str, *args: Any, **kwargs: Any) -> None: Logs a message with severity 'CRITICAL'.
     """
 
     _instance: "ApplicationLogger" = None  # type: ignore
     _initialized: bool = False
 
+    # severity numbers of loguru's levels, messages below `level_no` return before reaching loguru
+    TRACE_NO: int = 5
+    DEBUG_NO: int = 10
+    INFO_NO: int = 20
+    SUCCESS_NO: int = 25
+    WARNING_NO: int = 30
+    ERROR_NO: int = 40
+    CRITICAL_NO: int = 50
+
     def __new__(
         cls: type["ApplicationLogger"], *args: Any, **kwargs: Any
     ) -> "ApplicationLogger":
@@ -37,89 +50,146 @@ class ApplicationLogger:
         if ApplicationLogger._initialized:
             return
 
+        ensure_env_loaded()
+        level = os.getenv("LOG_LEVEL", "DEBUG").upper()
+
         # remove default handler to sys.stderr
         loguru_logger.remove()
 
-        loguru_logger.add(
-            sys.stdout,
-            level="DEBUG",
-            colorize=True,
-            backtrace=True,
-            diagnose=False,
-            format=(
-                "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-                "<level>{level: <8}</level> | "
-                "<cyan>{module}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-                "<level>{message}</level>"
-            ),
-        )
+        if os.getenv("APP_LOG_FORMAT", "text").lower() == "json":
+            # one serialized JSON record per line, e.g. for log collectors
+            loguru_logger.add(
+                sys.stdout,
+                level=level,
+                serialize=True,
+                backtrace=True,
+                diagnose=False,
+            )
+        else:
+            loguru_logger.add(
+                sys.stdout,
+                level=level,
+                # colors are only rendered if stdout is a terminal, piped logs stay free of escape codes
+                colorize=sys.stdout.isatty(),
+                backtrace=True,
+                diagnose=False,
+                format=(
+                    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+                    "<level>{level: <8}</level> | "
+                    "<cyan>{module}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+                    "<level>{message}</level>"
+                ),
+            )
 
         self.logger = loguru_logger
+        # reports the caller of the level methods instead of this class, created once instead of per message
+        self.caller_logger = loguru_logger.opt(depth=1)
+        self.level_no = loguru_logger.level(level).no
         self.logger.info(f"Logger initialized (ApplicationLogger id={id(self)})")
         ApplicationLogger._initialized = True
 
-    def trace(self, msg: str) -> None:
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Checks whether messages of a level are logged, so expensive messages can be skipped before they are formatted.
+
+        Args:
+            level (str): The name of the level, e.g. "DEBUG".
+
+        Returns:
+            bool: True if messages of the level reach the sink.
+        """
+        return self.logger.level(level).no >= self.level_no
+
+    def trace(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs a message with severity 'TRACE'.
 
         Args:
-            msg (str): Message that will be logged.
+            msg (str): Message that will be logged, may contain `{}` placeholders for the arguments.
+            *args (Any): Positional arguments formatted into the message only if it is logged.
+            **kwargs (Any): Keyword arguments formatted into the message only if it is logged.
         """
-        self.logger.opt(depth=1).trace(msg)
+        if self.level_no > self.TRACE_NO:
+            return
+        self.caller_logger.trace(msg, *args, **kwargs)
 
-    def debug(self, msg: str) -> None:
+    def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs a message with severity 'DEBUG'.
 
         Args:
-            msg (str): Message that will be logged.
+            msg (str): Message that will be logged, may contain `{}` placeholders for the arguments.
+            *args (Any): Positional arguments formatted into the message only if it is logged.
+            **kwargs (Any): Keyword arguments formatted into the message only if it is logged.
         """
-        self.logger.opt(depth=1).debug(msg)
+        if self.level_no > self.DEBUG_NO:
+            return
+        self.caller_logger.debug(msg, *args, **kwargs)
 
-    def info(self, msg: str) -> None:
+    def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs a message with severity 'INFO'.
 
         Args:
-            msg (str): Message that will be logged.
+            msg (str): Message that will be logged, may contain `{}` placeholders for the arguments.
+            *args (Any): Positional arguments formatted into the message only if it is logged.
+            **kwargs (Any): Keyword arguments formatted into the message only if it is logged.
         """
-        self.logger.opt(depth=1).info(msg)
+        if self.level_no > self.INFO_NO:
+            return
+        self.caller_logger.info(msg, *args, **kwargs)
 
-    def success(self, msg: str) -> None:
+    def success(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs a message with severity 'SUCCESS'.
 
         Args:
-            msg (str): Message that will be logged.
+            msg (str): Message that will be logged, may contain `{}` placeholders for the arguments.
+            *args (Any): Positional arguments formatted into the message only if it is logged.
+            **kwargs (Any): Keyword arguments formatted into the message only if it is logged.
         """
-        self.logger.opt(depth=1).success(msg)
+        if self.level_no > self.SUCCESS_NO:
+            return
+        self.caller_logger.success(msg, *args, **kwargs)
 
-    def warning(self, msg: str) -> None:
+    def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs a message with severity 'WARNING'.
 
         Args:
-            msg (str): Message that will be logged.
+            msg (str): Message that will be logged, may contain `{}` placeholders for the arguments.
+            *args (Any): Positional arguments formatted into the message only if it is logged.
+            **kwargs (Any): Keyword arguments formatted into the message only if it is logged.
         """
-        self.logger.opt(depth=1).warning(msg)
+        if self.level_no > self.WARNING_NO:
+            return
+        self.caller_logger.warning(msg, *args, **kwargs)
 
-    def error(self, msg: str) -> None:
+    def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs a message with severity 'ERROR'.
 
         Args:
-            msg (str): Message that will be logged.
+            msg (str): Message that will be logged, may contain `{}` placeholders for the arguments.
+            *args (Any): Positional arguments formatted into the message only if it is logged.
+            **kwargs (Any): Keyword arguments formatted into the message only if it is logged.
         """
-        self.logger.opt(depth=1).error(msg)
+        if self.level_no > self.ERROR_NO:
+            return
+        self.caller_logger.error(msg, *args, **kwargs)
 
-    def critical(self, msg: str) -> None:
+    def critical(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs a message with severity 'CRITICAL'.
 
         Args:
-            msg (str): Message that will be logged.
+            msg (str): Message that will be logged, may contain `{}` placeholders for the arguments.
+            *args (Any): Positional arguments formatted into the message only if it is logged.
+            **kwargs (Any): Keyword arguments formatted into the message only if it is logged.
         """
-        self.logger.opt(depth=1).critical(msg)
+        if self.level_no > self.CRITICAL_NO:
+            return
+        self.caller_logger.critical(msg, *args, **kwargs)
 
 
 def get_application_logger() -> ApplicationLogger:
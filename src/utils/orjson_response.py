@@ -0,0 +1,23 @@
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    A JSONResponse that renders its content with orjson.
+
+    Values orjson can not serialize natively (e.g. Decimal) are rendered as strings.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serializes the content of the response.
+
+        Args:
+            content (Any): The content of the response.
+
+        Returns:
+            bytes: The JSON encoded content.
+        """
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY, default=str)
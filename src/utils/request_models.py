@@ -1,4 +1,6 @@
 from pydantic import BaseModel
+from data.example.utils.EAcademicLevel import EAcademicLevel
+from data.example.utils.EGender import EGender
 
 
 class GenderAndAcademicLevelRequest(BaseModel):
@@ -13,8 +15,8 @@ class GenderAndAcademicLevelRequest(BaseModel):
         list[dict[Any, Any]]: A list of dictionaries containing student data.
     """
 
-    gender: str
-    academic_level: str
+    gender: EGender
+    academic_level: EAcademicLevel
 
 
 class CountryRequest(BaseModel):
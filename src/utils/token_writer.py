@@ -0,0 +1,53 @@
+from dataclasses import dataclass, field
+import sys
+import time
+from typing import TextIO
+
+
+@dataclass
+class TokenWriter:
+    """
+    Writes streamed tokens to a text stream, flushing them in small groups instead of per token.
+
+    Tokens are collected until `max_tokens` are pending or `max_delay` seconds passed since the last flush,
+    so the output still appears while it is streamed but with far fewer write and flush calls.
+
+    Attributes:
+        stream (TextIO): The stream the tokens are written to. Defaults to sys.stdout.
+        max_tokens (int): The number of pending tokens that triggers a flush. Defaults to 8.
+        max_delay (float): The time in seconds after which pending tokens are flushed. Defaults to 0.05.
+
+    Methods:
+        write(token: str) -> None: Queues a token and flushes if enough tokens are pending or enough time passed.
+        flush() -> None: Writes all pending tokens to the stream.
+    """
+
+    stream: TextIO = field(default_factory=lambda: sys.stdout)
+    max_tokens: int = 8
+    max_delay: float = 0.05
+    _pending: list[str] = field(default_factory=list, init=False)
+    _last_flush: float = field(default_factory=time.monotonic, init=False)
+
+    def write(self, token: str) -> None:
+        """
+        Queues a token and flushes if enough tokens are pending or enough time passed.
+
+        Args:
+            token (str): The token to write.
+        """
+        self._pending.append(token)
+        if (
+            len(self._pending) >= self.max_tokens
+            or time.monotonic() - self._last_flush >= self.max_delay
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes all pending tokens to the stream.
+        """
+        if self._pending:
+            self.stream.write("".join(self._pending))
+            self._pending.clear()
+        self.stream.flush()
+        self._last_flush = time.monotonic()
@@ -0,0 +1,69 @@
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Any, Hashable
+
+
+@dataclass
+class TTLCache:
+    """
+    A thread-safe in-memory cache whose entries expire after a fixed time to live.
+
+    Attributes:
+        ttl (float): The number of seconds an entry stays valid. Defaults to 60.
+        maxsize (int): The maximum number of entries, the oldest entry is evicted when it is exceeded. Defaults to 10000.
+
+    Methods:
+        get(key: Hashable) -> Any | None: Returns the cached value for a key if it has not expired.
+        set(key: Hashable, value: Any) -> None: Stores a value for a key.
+        clear() -> None: Removes all entries.
+    """
+
+    ttl: float = 60
+    maxsize: int = 10_000
+    _entries: dict[Hashable, tuple[float, Any]] = field(
+        default_factory=dict, init=False
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Returns the cached value for a key if it has not expired.
+
+        Args:
+            key (Hashable): The key of the entry.
+
+        Returns:
+            Any | None: The cached value or None if the key is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a value for a key.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (Any): The value to cache.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """
+        Removes all entries.
+        """
+        with self._lock:
+            self._entries.clear()
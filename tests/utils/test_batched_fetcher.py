@@ -0,0 +1,102 @@
+import asyncio
+from typing import Any, Callable
+import pytest
+from utils.batched_fetcher import BatchedFetcher
+
+
+def recording_fetch(
+    calls: list[list[Any]],
+) -> Callable[[list[Any]], dict[Any, Any]]:
+    """
+    Returns a fetch function that records the keys of every call and maps each key to its uppercased value.
+    """
+
+    def fetch_many(keys: list[Any]) -> dict[Any, Any]:
+        calls.append(keys)
+        return {key: key.upper() for key in keys}
+
+    return fetch_many
+
+
+def run(coroutine: Any) -> Any:
+    """
+    Runs a coroutine with a timeout, so a future that is never resolved fails the test instead of hanging it.
+    """
+    return asyncio.run(asyncio.wait_for(coroutine, timeout=2))
+
+
+def test_size_flush_fetches_without_waiting_for_the_timer() -> None:
+    calls: list[list[Any]] = []
+    fetcher = BatchedFetcher(
+        recording_fetch(calls), max_batch_size=3, max_wait_ms=60_000
+    )
+
+    async def submit_all() -> list[Any]:
+        return await asyncio.gather(*(fetcher.submit(key) for key in "abc"))
+
+    assert run(submit_all()) == ["A", "B", "C"]
+    assert calls == [["a", "b", "c"]]
+
+
+def test_timer_flush_fetches_a_partial_batch() -> None:
+    calls: list[list[Any]] = []
+    fetcher = BatchedFetcher(recording_fetch(calls), max_batch_size=100, max_wait_ms=5)
+
+    async def submit_all() -> list[Any]:
+        return await asyncio.gather(fetcher.submit("a"), fetcher.submit("b"))
+
+    assert run(submit_all()) == ["A", "B"]
+    assert calls == [["a", "b"]]
+
+
+def test_duplicate_keys_are_fetched_once() -> None:
+    calls: list[list[Any]] = []
+    fetcher = BatchedFetcher(recording_fetch(calls), max_wait_ms=5)
+
+    async def submit_all() -> list[Any]:
+        return await asyncio.gather(*(fetcher.submit(key) for key in "aba"))
+
+    assert run(submit_all()) == ["A", "B", "A"]
+    assert calls == [["a", "b"]]
+
+
+def test_missing_key_raises_key_error_only_for_its_callers() -> None:
+    def fetch_many(keys: list[Any]) -> dict[Any, Any]:
+        return {"a": "A"}
+
+    fetcher = BatchedFetcher(fetch_many, max_wait_ms=5)
+
+    async def submit_all() -> list[Any]:
+        return await asyncio.gather(
+            fetcher.submit("a"), fetcher.submit("b"), return_exceptions=True
+        )
+
+    found, missing = run(submit_all())
+    assert found == "A"
+    assert isinstance(missing, KeyError)
+
+
+def test_fetch_error_reaches_every_caller() -> None:
+    error = RuntimeError("database unavailable")
+
+    def fetch_many(keys: list[Any]) -> dict[Any, Any]:
+        raise error
+
+    fetcher = BatchedFetcher(fetch_many, max_wait_ms=5)
+
+    async def submit_all() -> list[Any]:
+        return await asyncio.gather(
+            *(fetcher.submit(key) for key in "abc"), return_exceptions=True
+        )
+
+    assert run(submit_all()) == [error, error, error]
+
+
+def test_fetch_error_is_raised_to_a_single_caller() -> None:
+    def fetch_many(keys: list[Any]) -> dict[Any, Any]:
+        raise ValueError("bad key")
+
+    fetcher = BatchedFetcher(fetch_many, max_wait_ms=5)
+
+    with pytest.raises(ValueError, match="bad key"):
+        run(fetcher.submit("a"))
@@ -0,0 +1,22 @@
+import pytest
+from utils.env import get_bool_env
+
+
+@pytest.mark.parametrize("value", ["1", "true", "True", "YES", " yes "])
+def test_truthy_values(monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+    monkeypatch.setenv("TEST_FLAG", value)
+    assert get_bool_env("TEST_FLAG", False) is True
+
+
+@pytest.mark.parametrize("value", ["0", "false", "no", "", "on"])
+def test_other_values_are_false(monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+    monkeypatch.setenv("TEST_FLAG", value)
+    assert get_bool_env("TEST_FLAG", True) is False
+
+
+@pytest.mark.parametrize("default", [True, False])
+def test_unset_variable_returns_the_default(
+    monkeypatch: pytest.MonkeyPatch, default: bool
+) -> None:
+    monkeypatch.delenv("TEST_FLAG", raising=False)
+    assert get_bool_env("TEST_FLAG", default) is default
@@ -0,0 +1,47 @@
+import io
+import pytest
+from utils import token_writer
+from utils.token_writer import TokenWriter
+
+
+def test_tokens_are_held_back_until_max_tokens_are_pending() -> None:
+    stream = io.StringIO()
+    writer = TokenWriter(stream=stream, max_tokens=3, max_delay=60)
+
+    writer.write("a")
+    writer.write("b")
+    assert stream.getvalue() == ""
+
+    writer.write("c")
+    assert stream.getvalue() == "abc"
+
+    writer.write("d")
+    assert stream.getvalue() == "abc"
+
+
+def test_pending_tokens_are_written_after_max_delay(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stream = io.StringIO()
+    writer = TokenWriter(stream=stream, max_tokens=100, max_delay=0.05)
+    started = writer._last_flush
+
+    monkeypatch.setattr(token_writer.time, "monotonic", lambda: started + 0.01)
+    writer.write("a")
+    assert stream.getvalue() == ""
+
+    monkeypatch.setattr(token_writer.time, "monotonic", lambda: started + 0.06)
+    writer.write("b")
+    assert stream.getvalue() == "ab"
+
+
+def test_flush_writes_the_remaining_tokens() -> None:
+    stream = io.StringIO()
+    writer = TokenWriter(stream=stream, max_tokens=100, max_delay=60)
+
+    writer.write("a")
+    writer.flush()
+    assert stream.getvalue() == "a"
+
+    writer.flush()
+    assert stream.getvalue() == "a"
@@ -0,0 +1,73 @@
+import pytest
+from utils import ttl_cache
+from utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """
+    A monotonic clock that only advances when told to.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", fake)
+    return fake
+
+
+def test_entry_is_returned_until_it_expires(clock: FakeClock) -> None:
+    cache = TTLCache(ttl=10)
+    cache.set("key", "value")
+
+    clock.now += 10
+    assert cache.get("key") == "value"
+
+    clock.now += 0.1
+    assert cache.get("key") is None
+
+
+def test_setting_a_key_again_renews_its_ttl(clock: FakeClock) -> None:
+    cache = TTLCache(ttl=10)
+    cache.set("key", "old")
+    clock.now += 8
+    cache.set("key", "new")
+
+    clock.now += 8
+    assert cache.get("key") == "new"
+
+
+def test_oldest_entry_is_evicted_when_full(clock: FakeClock) -> None:
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_setting_a_key_again_protects_it_from_eviction(clock: FakeClock) -> None:
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 10)
+    cache.set("c", 3)
+
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+
+
+def test_clear_removes_all_entries(clock: FakeClock) -> None:
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.clear()
+
+    assert cache.get("a") is None